@@ -1,7 +1,7 @@
 """Abstract base class for state storage backends."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 
 class StateBackend(ABC):
@@ -62,6 +62,28 @@ class StateBackend(ABC):
         """
         pass
     
+    def apply_file_cache_changes(
+        self, updated: Dict[str, Dict], removed: Iterable[str], delta_token: str
+    ) -> None:
+        """Write one delta's file cache changes and its new delta token.
+        
+        This default loads the whole state, applies the changes and saves it
+        back. Backends that can write rows individually override it so the
+        cost is O(changes) rather than that of a full :meth:`save`.
+        
+        Args:
+            updated: Dict mapping path -> metadata for added/modified items
+            removed: Paths of deleted items
+            delta_token: Delta token to store alongside the changes
+        """
+        state = self.load()
+        file_cache = state.setdefault('file_cache', {})
+        file_cache.update(updated)
+        for path in removed:
+            file_cache.pop(path, None)
+        state['delta_token'] = delta_token
+        self.save(state)
+    
     @abstractmethod
     def get_all_file_cache(self) -> Dict[str, Dict]:
         """Get all cached files.
@@ -5,7 +5,7 @@ import logging
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 from .base import StateBackend
 
@@ -288,6 +288,22 @@ class SqliteStateBackend(StateBackend):
             with self.conn:
                 self.conn.execute("DELETE FROM file_cache WHERE path = ?", (path,))
     
+    def apply_file_cache_changes(
+        self, updated: Dict[str, Dict], removed: Iterable[str], delta_token: str
+    ) -> None:
+        """Write one delta's file cache changes in a single transaction."""
+        with self._write_lock:
+            with self.conn:
+                if updated:
+                    self._batch_insert_cache_unlocked(updated)
+                self.conn.executemany(
+                    "DELETE FROM file_cache WHERE path = ?", ((path,) for path in removed)
+                )
+                self.conn.execute("""
+                    INSERT OR REPLACE INTO metadata (key, value) 
+                    VALUES (?, ?)
+                """, ('delta_token', delta_token))
+    
     def get_all_file_cache(self) -> Dict[str, Dict]:
         """Get all cached files."""
         rows = self.conn.execute("SELECT * FROM file_cache").fetchall()
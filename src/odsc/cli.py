@@ -121,31 +121,40 @@ def cmd_config(args):
         return 0
     
     if args.set:
-        for item in args.set:
-            if '=' not in item:
-                print(f"Error: Invalid format '{item}'. Use key=value")
-                continue
-            
-            key, value = item.split('=', 1)
-            
-            # Type conversion for known keys
-            try:
-                if key == 'sync_interval':
-                    value = int(value)
-                elif key == 'sync_directory':
-                    value = str(Path(value).expanduser())
-                
-                # Set with validation
-                config.set(key, value)
-                print(f"✓ Set {key} = {value}")
-                
-            except ValueError as e:
-                print(f"✗ Error setting {key}: {e}")
-                continue
-            except Exception as e:
-                print(f"✗ Unexpected error setting {key}: {e}")
-                continue
+        # Report successes only once the batch has actually been written
+        applied = []
+        try:
+            with config.batch():
+                for item in args.set:
+                    if '=' not in item:
+                        print(f"Error: Invalid format '{item}'. Use key=value")
+                        continue
+                    
+                    key, value = item.split('=', 1)
+                    
+                    # Type conversion for known keys
+                    try:
+                        if key == 'sync_interval':
+                            value = int(value)
+                        elif key == 'sync_directory':
+                            value = str(Path(value).expanduser())
+                        
+                        # Set with validation
+                        config.set(key, value)
+                        applied.append(f"✓ Set {key} = {value}")
+                        
+                    except ValueError as e:
+                        print(f"✗ Error setting {key}: {e}")
+                        continue
+                    except Exception as e:
+                        print(f"✗ Unexpected error setting {key}: {e}")
+                        continue
+        except Exception as e:
+            print(f"✗ Error saving configuration: {e}")
+            return 1
         
+        for line in applied:
+            print(line)
         return 0
     
     print("Use --list to view config or --set key=value to change config")
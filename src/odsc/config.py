@@ -42,8 +42,9 @@ Performance:
 
 import json
 import logging
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
 
 from .file_io import atomic_write
 from .token_store import TokenStore
@@ -80,6 +81,8 @@ class Config:
         self.force_sync_path = self.config_dir / self.FORCE_SYNC_FILE
         
         self._config: Dict[str, Any] = {}
+        self._batch_depth = 0
+        self._dirty = False
         self._backend: Optional[StateBackend] = None
         self._token_store = TokenStore(self.token_path)
         self.load()
@@ -155,6 +158,7 @@ class Config:
     
     def save(self) -> None:
         """Save configuration to file."""
+        self._dirty = False
         data = json.dumps(self._config, indent=2).encode()
         atomic_write(self.config_path, data, mode=0o600)
     
@@ -170,12 +174,13 @@ class Config:
         """
         return self._config.get(key, default)
     
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, save: bool = True) -> None:
         """Set configuration value with validation.
         
         Args:
             key: Configuration key
             value: Configuration value
+            save: Write the config file now (deferred inside :meth:`batch`)
             
         Raises:
             ValueError: If value is invalid for the given key
@@ -187,9 +192,27 @@ class Config:
             # Convert ValidationError to ValueError for backward compatibility
             raise ValueError(str(e))
         self._config[key] = validated_value
-        self.save()
+        if save and self._batch_depth == 0:
+            self.save()
+        else:
+            self._dirty = True
+    
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Defer config file writes until the outermost batch exits.
+        
+        Several ``set()`` calls inside the block result in a single save,
+        which also happens if the block raises after some values were set.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self.save()
     
-
     @property
     def sync_directory(self) -> Path:
         """Get sync directory path."""
@@ -273,6 +296,22 @@ class Config:
             logger.error(f"Failed to persist sync entry {rel_path}: {e}")
             raise
     
+    def save_file_cache_changes(
+        self, updated: Dict[str, Dict[str, Any]], removed: Iterable[str], delta_token: str
+    ) -> None:
+        """Persist one delta's file cache changes without rewriting the whole DB.
+
+        Used by the GUI refresh so a delta costs writes proportional to the
+        number of changes rather than to the size of the drive.
+        """
+        if self._backend is None:
+            self._init_backend()
+        try:
+            self._backend.apply_file_cache_changes(updated, removed, delta_token)
+        except Exception as e:
+            logger.error(f"Failed to save file cache changes: {e}")
+            raise
+    
     def load_state(self) -> Dict[str, Any]:
         """Load sync state using backend.
         
@@ -31,25 +31,13 @@ def main():
             super().__init__(application_id="com.github.odsc",
                              flags=Gio.ApplicationFlags.DEFAULT_FLAGS)
             self.window = None
+            self.splash_window = None
             self.config = Config()
         
         def do_activate(self):
             """Activate the application."""
             if not self.window:
-                # Create main window first
-                self.window = OneDriveGUI(self)
-                self.window.show_all()
-                
-                # Show splash screen only if enabled in config
-                if self.config.show_splash:
-                    splash = SplashScreen(show_close_button=False)
-                    splash.set_transient_for(self.window)
-                    splash.set_modal(True)
-                    splash.show_all()
-                    
-                    # Auto-close splash after 5 seconds (launch mode only)
-                    GLib.timeout_add(5000, splash.close_splash)
-                
+                self._create_main()
             else:
                 # Window already exists - bring it to focus
                 self.window.show_all()
@@ -64,9 +52,31 @@ def main():
                 # Also try present() for good measure
                 self.window.present()
                 
-                # Clear urgency hint after a moment
-                GLib.timeout_add(100, lambda: self.window.set_urgency_hint(False) or False)
+                # Clear urgency hint once the main loop is idle
+                GLib.idle_add(self._clear_urgency, priority=GLib.PRIORITY_LOW)
+            
+            return False
+        
+        def _create_main(self):
+            """Create the main window and optional launch splash screen."""
+            # Create main window first
+            self.window = OneDriveGUI(self)
+            self.window.show_all()
             
+            # Show splash screen only if enabled in config
+            if self.config.show_splash:
+                splash = SplashScreen(show_close_button=False)
+                splash.set_transient_for(self.window)
+                splash.set_modal(True)
+                splash.show_all()
+                self.splash_window = splash
+                
+                # Auto-close splash after 5 seconds (launch mode only)
+                GLib.timeout_add(5000, splash.close_splash)
+        
+        def _clear_urgency(self):
+            """Clear the urgency hint set on re-activation."""
+            self.window.set_urgency_hint(False)
             return False
     
     app = OneDriveApplication()
@@ -1,28 +1,67 @@
 """DaemonController — centralized management of the ODSC systemd service.
 
 All GUI code that needs to start/stop/restart/query the daemon imports this
-class instead of duplicating subprocess + systemctl boilerplate.
+class instead of duplicating systemd boilerplate. The service is managed
+through the systemd user manager's D-Bus API on one shared session bus
+connection rather than by spawning ``systemctl`` for every action.
 """
 
 from __future__ import annotations
 
 import logging
-import subprocess
+from typing import Callable, Optional
+
+from gi.repository import Gio, GLib
 
 logger = logging.getLogger(__name__)
 
 _SERVICE = "odsc.service"
 _SERVICE_SHORT = "odsc"
 
+_SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+_SYSTEMD_PATH = "/org/freedesktop/systemd1"
+_MANAGER_IFACE = "org.freedesktop.systemd1.Manager"
+_UNIT_IFACE = "org.freedesktop.systemd1.Unit"
+_PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
+
+# D-Bus call timeouts (ms)
+_STATUS_TIMEOUT_MS = 5000
+_LIFECYCLE_TIMEOUT_MS = 10000
+
+# Unit ActiveState values `systemctl is-active` reports as success
+_ACTIVE_STATES = ("active", "reloading")
+
+# JobRemoved result of a job that completed successfully
+_JOB_DONE = "done"
+
+
+def _dbus_error_message(error: GLib.Error) -> str:
+    """Return a D-Bus error's message without the ``GDBus.Error:<name>:`` prefix.
+
+    ``Gio.DBusError.strip_remote_error`` does not change the message of the
+    Python exception PyGObject hands us, so the prefix is removed here.
+    """
+    message = error.message
+    if message.startswith("GDBus.Error:"):
+        _, sep, rest = message.partition(": ")
+        if sep:
+            return rest
+    return message
+
 
 class DaemonController:
     """Manages the ODSC systemd user service lifecycle.
 
     All methods return a ``(success: bool, message: str)`` tuple so callers
     can decide how to present feedback without this class touching any GTK
-    widgets.
+    widgets. The ``*_async`` variants deliver the same results to a callback
+    instead; they must be called from the GTK main thread, whose main loop
+    then runs the callback, so the UI never waits on systemd.
     """
 
+    def __init__(self) -> None:
+        self._bus: Optional[Gio.DBusConnection] = None
+
     # --------------------------------------------------------------------- #
     # Status                                                                  #
     # --------------------------------------------------------------------- #
@@ -30,16 +69,45 @@ class DaemonController:
     def is_running(self) -> bool:
         """Return True if the daemon service is currently active."""
         try:
-            result = subprocess.run(
-                ["systemctl", "--user", "is-active", _SERVICE],
-                capture_output=True,
-                text=True,
-                timeout=5,
+            # GetUnit fails with NoSuchUnit when the unit is not loaded
+            unit_path = self._call_manager(
+                "GetUnit", GLib.Variant("(s)", (_SERVICE,)), _STATUS_TIMEOUT_MS
+            )[0]
+            reply = self._get_bus().call_sync(
+                _SYSTEMD_BUS_NAME,
+                unit_path,
+                _PROPERTIES_IFACE,
+                "Get",
+                GLib.Variant("(ss)", (_UNIT_IFACE, "ActiveState")),
+                GLib.VariantType.new("(v)"),
+                Gio.DBusCallFlags.NONE,
+                _STATUS_TIMEOUT_MS,
+                None,
             )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            return reply.unpack()[0] in _ACTIVE_STATES
+        except GLib.Error:
             return False
 
+    def is_running_async(self, callback: Callable[[bool], None]) -> None:
+        """Non-blocking :meth:`is_running`; calls ``callback(is_running)``."""
+        def on_state(reply, error):
+            callback(error is None and reply[0] in _ACTIVE_STATES)
+
+        def on_unit(reply, error):
+            if error is not None:
+                callback(False)
+                return
+            self._call_async(
+                reply[0], _PROPERTIES_IFACE, "Get",
+                GLib.Variant("(ss)", (_UNIT_IFACE, "ActiveState")), "(v)",
+                _STATUS_TIMEOUT_MS, on_state,
+            )
+
+        self._call_async(
+            _SYSTEMD_PATH, _MANAGER_IFACE, "GetUnit",
+            GLib.Variant("(s)", (_SERVICE,)), "(o)", _STATUS_TIMEOUT_MS, on_unit,
+        )
+
     # --------------------------------------------------------------------- #
     # Lifecycle                                                               #
     # --------------------------------------------------------------------- #
@@ -50,7 +118,7 @@ class DaemonController:
         Returns:
             (success, human-readable message)
         """
-        return self._run(["systemctl", "--user", "start", _SERVICE_SHORT], timeout=10)
+        return self._manage_unit("StartUnit")
 
     def stop(self) -> tuple[bool, str]:
         """Stop the daemon service.
@@ -58,7 +126,7 @@ class DaemonController:
         Returns:
             (success, human-readable message)
         """
-        return self._run(["systemctl", "--user", "stop", _SERVICE_SHORT], timeout=10)
+        return self._manage_unit("StopUnit")
 
     def restart(self) -> tuple[bool, str]:
         """Restart the daemon service (start it if not running).
@@ -67,43 +135,264 @@ class DaemonController:
             (success, human-readable message)
         """
         if self.is_running():
-            return self._run(
-                ["systemctl", "--user", "restart", _SERVICE_SHORT], timeout=10
-            )
+            return self._manage_unit("RestartUnit")
         else:
             return self.start()
 
+    def start_async(self, callback: Callable[[bool, str], None]) -> None:
+        """Non-blocking :meth:`start`; calls ``callback(success, message)``."""
+        self._manage_unit_async("StartUnit", callback)
+
+    def restart_async(self, callback: Callable[[bool, str], None]) -> None:
+        """Non-blocking :meth:`restart`; calls ``callback(success, message)``."""
+        def on_status(is_running):
+            self._manage_unit_async("RestartUnit" if is_running else "StartUnit", callback)
+
+        self.is_running_async(on_status)
+
+    def restart_running_async(self, callback: Callable[[bool, str], None]) -> None:
+        """Non-blocking restart for callers that already know the service runs.
+
+        Skips the status query :meth:`restart_async` makes first.
+        """
+        self._manage_unit_async("RestartUnit", callback)
+
     # --------------------------------------------------------------------- #
     # Internal                                                                #
     # --------------------------------------------------------------------- #
 
-    def _run(self, cmd: list[str], timeout: int) -> tuple[bool, str]:
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+    def _get_bus(self) -> Gio.DBusConnection:
+        """Return the session bus connection, opening it on first use."""
+        if self._bus is None:
+            self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        return self._bus
+
+    def _get_bus_async(
+        self,
+        on_bus: Callable[[Optional[Gio.DBusConnection], Optional[GLib.Error]], None],
+    ) -> None:
+        """Non-blocking :meth:`_get_bus`; calls ``on_bus(bus, error)``."""
+        if self._bus is not None:
+            on_bus(self._bus, None)
+            return
+
+        def on_ready(_source, result):
+            try:
+                bus = Gio.bus_get_finish(result)
+            except GLib.Error as exc:
+                on_bus(None, exc)
+                return
+            self._bus = bus
+            on_bus(bus, None)
+
+        Gio.bus_get(Gio.BusType.SESSION, None, on_ready)
+
+    def _call_manager(self, method: str, args: GLib.Variant, timeout_ms: int) -> tuple:
+        """Call a systemd Manager method that returns a unit or job path."""
+        reply = self._get_bus().call_sync(
+            _SYSTEMD_BUS_NAME,
+            _SYSTEMD_PATH,
+            _MANAGER_IFACE,
+            method,
+            args,
+            GLib.VariantType.new("(o)"),
+            Gio.DBusCallFlags.NONE,
+            timeout_ms,
+            None,
+        )
+        return reply.unpack()
+
+    def _call_async(
+        self,
+        object_path: str,
+        interface: str,
+        method: str,
+        args: GLib.Variant,
+        reply_type: str,
+        timeout_ms: int,
+        on_done: Callable[[Optional[tuple], Optional[GLib.Error]], None],
+    ) -> None:
+        """Start a systemd D-Bus call; ``on_done(reply, error)`` gets the result.
+
+        Exactly one of ``reply`` (the unpacked reply tuple) and ``error`` is
+        None. Failing to reach the session bus is reported the same way.
+        """
+        def on_reply(source, result):
+            try:
+                reply = source.call_finish(result).unpack()
+            except GLib.Error as exc:
+                on_done(None, exc)
+                return
+            on_done(reply, None)
+
+        def on_bus(bus, error):
+            if error is not None:
+                on_done(None, error)
+                return
+            bus.call(
+                _SYSTEMD_BUS_NAME,
+                object_path,
+                interface,
+                method,
+                args,
+                GLib.VariantType.new(reply_type),
+                Gio.DBusCallFlags.NONE,
+                timeout_ms,
+                None,
+                on_reply,
             )
-            if result.returncode == 0:
-                logger.info(f"daemon_controller: {' '.join(cmd)} succeeded")
-                return True, ""
-            else:
-                msg = result.stderr.strip() or result.stdout.strip()
-                logger.error(f"daemon_controller: {' '.join(cmd)} failed: {msg}")
-                return False, msg
-        except subprocess.TimeoutExpired:
-            msg = f"Timed out after {timeout}s running {' '.join(cmd)}"
-            logger.error(f"daemon_controller: {msg}")
-            return False, msg
-        except FileNotFoundError:
+
+        self._get_bus_async(on_bus)
+
+    def _manage_unit_async(self, method: str, callback: Callable[[bool, str], None]) -> None:
+        """Non-blocking :meth:`_manage_unit`.
+
+        ``callback`` runs once the job has been removed, or the lifecycle
+        timeout has passed, with the same outcome :meth:`_manage_unit` returns.
+        """
+        def on_bus(bus, error):
+            if error is not None:
+                logger.error(f"daemon_controller: session bus unavailable: {error.message}")
+                callback(False, error.message)
+                return
+
+            # Results that arrive before the StartUnit reply names our job
+            early_results: dict[str, str] = {}
+            job_path: Optional[str] = None
+            timeout_id = 0
+
+            def finish(result):
+                nonlocal timeout_id
+                bus.signal_unsubscribe(subscription)
+                if timeout_id:
+                    GLib.source_remove(timeout_id)
+                    timeout_id = 0
+                callback(*self._job_outcome(method, result))
+
+            def on_removed(removed_path, result):
+                if job_path is None:
+                    early_results[removed_path] = result
+                elif removed_path == job_path:
+                    finish(result)
+
+            def on_timeout():
+                nonlocal timeout_id
+                timeout_id = 0
+                finish("timeout")
+                return False
+
+            def on_queued(reply, error):
+                nonlocal job_path, timeout_id
+                if error is not None:
+                    bus.signal_unsubscribe(subscription)
+                    msg = _dbus_error_message(error)
+                    logger.error(f"daemon_controller: {method} {_SERVICE} failed: {msg}")
+                    callback(False, msg)
+                    return
+                job_path = reply[0]
+                if job_path in early_results:
+                    finish(early_results[job_path])
+                else:
+                    timeout_id = GLib.timeout_add(_LIFECYCLE_TIMEOUT_MS, on_timeout)
+
+            subscription = self._subscribe_job_removed(bus, on_removed)
+            self._call_async(
+                _SYSTEMD_PATH, _MANAGER_IFACE, method,
+                GLib.Variant("(ss)", (_SERVICE, "replace")), "(o)",
+                _LIFECYCLE_TIMEOUT_MS, on_queued,
+            )
+
+        self._get_bus_async(on_bus)
+
+    def _subscribe_job_removed(
+        self, bus: Gio.DBusConnection, on_removed: Callable[[str, str], None]
+    ) -> int:
+        """Subscribe ``on_removed(job_path, result)`` to the Manager's JobRemoved.
+
+        systemd sends JobRemoved to the client that queued the job, so no
+        Manager.Subscribe call is needed. Subscribe *before* queueing the job
+        so a job that finishes immediately cannot be missed. The handler
+        runs in the thread-default main context at the time of this call.
+        """
+        def on_signal(_conn, _sender, _path, _iface, _signal, params):
+            _job_id, job_path, _unit, result = params.unpack()
+            on_removed(job_path, result)
+
+        return bus.signal_subscribe(
+            _SYSTEMD_BUS_NAME,
+            _MANAGER_IFACE,
+            "JobRemoved",
+            _SYSTEMD_PATH,
+            None,
+            Gio.DBusSignalFlags.NONE,
+            on_signal,
+        )
+
+    @staticmethod
+    def _job_outcome(method: str, result: str) -> tuple[bool, str]:
+        """Turn a JobRemoved result into the ``(success, message)`` tuple."""
+        if result == _JOB_DONE:
+            logger.info(f"daemon_controller: {method} {_SERVICE} succeeded")
+            return True, ""
+        msg = (
+            f"{method} job for {_SERVICE} finished with result '{result}'. See "
+            f"'systemctl --user status {_SERVICE_SHORT}' for details."
+        )
+        logger.error(f"daemon_controller: {msg}")
+        return False, msg
+
+    def _manage_unit(self, method: str) -> tuple[bool, str]:
+        """Run a start/stop/restart job for the service and wait for it.
+
+        Like ``systemctl start``, succeeds only once the job has finished
+        with result ``done``; a unit that fails to start, or a job still
+        running after the lifecycle timeout, is reported as a failure.
+        """
+        try:
+            bus = self._get_bus()
+        except GLib.Error as exc:
             msg = (
-                "systemctl not found — please manage the daemon manually:\n"
-                f"  systemctl --user start {_SERVICE_SHORT}"
+                "Could not reach the systemd user manager — please manage the "
+                f"daemon manually:\n  systemctl --user start {_SERVICE_SHORT}"
             )
-            logger.error(f"daemon_controller: systemctl not found")
+            logger.error(f"daemon_controller: session bus unavailable: {exc.message}")
             return False, msg
-        except Exception as exc:
-            msg = str(exc)
-            logger.error(f"daemon_controller: unexpected error: {msg}", exc_info=True)
+
+        # Private context so waiting for JobRemoved does not dispatch
+        # unrelated sources of the caller's main loop
+        context = GLib.MainContext.new()
+        context.push_thread_default()
+        results: dict[str, str] = {}
+        subscription = self._subscribe_job_removed(bus, results.__setitem__)
+        try:
+            job_path = self._call_manager(
+                method, GLib.Variant("(ss)", (_SERVICE, "replace")), _LIFECYCLE_TIMEOUT_MS
+            )[0]
+            return self._job_outcome(method, self._wait_for_job(context, results, job_path))
+        except GLib.Error as exc:
+            msg = _dbus_error_message(exc)
+            logger.error(f"daemon_controller: {method} {_SERVICE} failed: {msg}")
             return False, msg
+        finally:
+            bus.signal_unsubscribe(subscription)
+            context.pop_thread_default()
+
+    @staticmethod
+    def _wait_for_job(
+        context: GLib.MainContext, results: dict[str, str], job_path: str
+    ) -> str:
+        """Iterate ``context`` until ``job_path`` is removed; return its result.
+
+        Returns ``"timeout"`` if the job is still pending after the
+        lifecycle timeout.
+        """
+        timed_out = []
+        timer = GLib.timeout_source_new(_LIFECYCLE_TIMEOUT_MS)
+        timer.set_callback(lambda *_: timed_out.append(True) or False)
+        timer.attach(context)
+        try:
+            while job_path not in results and not timed_out:
+                context.iteration(True)
+        finally:
+            timer.destroy()
+        return results.get(job_path, "timeout")
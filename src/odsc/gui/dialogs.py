@@ -1,27 +1,128 @@
 """Dialog classes for ODSC GUI."""
 
-import html
+import functools
 import logging
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, Gdk, GLib
 
 from ..config import Config
 from ..onedrive_client import OneDriveClient
-from ..logging_config import setup_logging
+from ..logging_config import set_log_level
+from ..validators import LOG_LEVELS
 
 logger = logging.getLogger(__name__)
 
+# Combo box row for each log level
+_LOG_LEVEL_INDEX = {level: i for i, level in enumerate(LOG_LEVELS)}
+
+# Appended to every restart prompt raised by a settings change
+_RESTART_TAIL = "\n\nThe daemon needs to be restarted for this change to take effect."
+_RESTART_TAIL_MANY = "\n\nThe daemon needs to be restarted for these changes to take effect."
+
+# Key column width for info rows (replaces per-label set_width_chars(15)).
+# GTK3 CSS has no ch unit, so 15 average-width characters (about half an em
+# each) are expressed as 8em. Copyable values are frameless read-only
+# entries that should look like labels
+_DIALOG_CSS = b"""
+.odsc-kv-label {
+    min-width: 8em;
+}
+entry.odsc-kv-value {
+    background: none;
+    border: none;
+    box-shadow: none;
+    padding: 0;
+    min-height: 0;
+}
+"""
+_css_installed = False
+
+
+def _install_css() -> None:
+    """Register the dialog style provider for the default screen once per process."""
+    global _css_installed
+    if _css_installed:
+        return
+    screen = Gdk.Screen.get_default()
+    if screen is None:
+        return
+    provider = Gtk.CssProvider()
+    provider.load_from_data(_DIALOG_CSS)
+    Gtk.StyleContext.add_provider_for_screen(
+        screen, provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _css_installed = True
+
+
+@functools.lru_cache(maxsize=16)
+def _format_timestamp(ts: int, fmt: str) -> str:
+    """Format an epoch timestamp in local time, memoized per (ts, fmt)."""
+    return datetime.fromtimestamp(ts).strftime(fmt)
+
+
+def _add_classes(widget: Gtk.Widget, classes) -> None:
+    """Add several style classes through a single style context lookup."""
+    ctx = widget.get_style_context()
+    for name in classes:
+        ctx.add_class(name)
+
+
+def _build_group(title: str, description: str, content: Gtk.Widget) -> Gtk.Box:
+    """Build a Libadwaita-style group: heading, caption and a framed body."""
+    group_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+    
+    # Header
+    header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3, margin_start=12)
+    
+    title_label = Gtk.Label(label=title, halign=Gtk.Align.START)
+    title_label.get_style_context().add_class("heading")
+    header_box.pack_start(title_label, False, False, 0)
+    
+    desc_label = Gtk.Label(label=description, halign=Gtk.Align.START)
+    _add_classes(desc_label, ("dim-label", "caption"))
+    header_box.pack_start(desc_label, False, False, 0)
+    
+    group_box.pack_start(header_box, False, False, 0)
+    
+    # Boxed list frame
+    frame = Gtk.Frame()
+    frame.set_shadow_type(Gtk.ShadowType.IN)
+    frame.get_style_context().add_class("view")
+    frame.add(content)
+    
+    group_box.pack_start(frame, False, False, 0)
+    return group_box
+
+
+def _readonly_entry(text: str) -> Gtk.Entry:
+    """Create a frameless, non-editable entry for a copyable value."""
+    entry = Gtk.Entry(text=text, editable=False, has_frame=False, hexpand=True,
+                      halign=Gtk.Align.FILL, xalign=0)
+    entry.get_style_context().add_class("odsc-kv-value")
+    return entry
+
+
+def _insert_rows(list_box: Gtk.ListBox, rows) -> None:
+    """Append prepared rows to a list box in one batch."""
+    list_box.freeze_child_notify()
+    for row in rows:
+        list_box.insert(row, -1)
+    list_box.thaw_child_notify()
+
 
 class DialogHelper:
     """Reusable dialog utilities to reduce code duplication."""
     
+    # Static-only namespace, never instantiated
+    __slots__ = ()
+    
     @staticmethod
     def show_info(parent, title: str, message: str, secondary: str = "") -> None:
         """Show information dialog."""
@@ -59,7 +160,8 @@ class DialogHelper:
             buttons=Gtk.ButtonsType.OK,
             text=title
         )
-        dialog.format_secondary_text(message)
+        if message:
+            dialog.format_secondary_text(message)
         dialog.run()
         dialog.destroy()
     
@@ -83,20 +185,48 @@ class DialogHelper:
 class AuthInfoDialog(Gtk.Dialog):
     """Authentication information and management dialog."""
     
+    # (group title, group description, (label, value, selectable, wrap) rows)
+    _AUTHENTICATED_LAYOUT = (
+        ("Account Information", "Microsoft account details", (
+            ("Account", "Loading...", False, False),
+        )),
+        ("Session Information", "Authentication status", (
+            ("Status", "✓ Authenticated", False, False),
+            ("Token Validity", "", False, False),
+        )),
+    )
+    _NOT_AUTHENTICATED_LAYOUT = (
+        ("Not Authenticated", "You are not currently authenticated with OneDrive", (
+            ("Action Required",
+             "Use Authentication → Login to authenticate with your Microsoft account",
+             False, True),
+        )),
+    )
+    
     def __init__(self, parent, config: Config, client: Optional[OneDriveClient]):
         """Initialize dialog.
         
+        Only the dialog frame is set up here; call :meth:`refresh` before
+        presenting it to build and populate the body.
+        
         Args:
             parent: Parent window
             config: Configuration object
             client: OneDrive client (None if not authenticated)
         """
         Gtk.Dialog.__init__(self, title="Authentication", transient_for=parent, flags=0)
+        _install_css()
         
         self.config = config
         self.client = client
         self._destroyed = False
+        self._authenticated: Optional[bool] = None
+        self._main_box: Optional[Gtk.Box] = None
         self._account_group = None
+        self._token_validity_label = None
+        # (expires_at, client_id) the account rows were last rendered for
+        self._render_key: Optional[Tuple[Any, str]] = None
+        self._pending_render_key: Optional[Tuple[Any, str]] = None
         self.connect("destroy", self._on_destroy)
         self.set_default_size(550, 400)
         self.set_border_width(0)
@@ -108,54 +238,85 @@ class AuthInfoDialog(Gtk.Dialog):
         box.set_margin_start(24)
         box.set_margin_end(24)
         
-        # Main container
+        self.add_button("_Close", Gtk.ResponseType.CLOSE)
+        # Closing via the window manager hides the dialog so it can be reused
+        self.connect("delete-event", Gtk.Widget.hide_on_delete)
+    
+    def refresh(self, client: Optional[OneDriveClient]) -> None:
+        """Update the dialog for the current authentication state.
+        
+        The dialog body is built lazily on the first call, and afterwards
+        only rebuilt when the authenticated/not-authenticated state changes;
+        otherwise the existing rows are reused and just their values are
+        refreshed, so a hidden dialog can be re-presented cheaply. The
+        account rows are left untouched when the token and client have not
+        changed since they were last rendered.
+        
+        Args:
+            client: OneDrive client (None if not authenticated)
+        """
+        self.client = client
+        # The client already holds the live token; only fall back to disk
+        # when there is no client
+        if client is not None:
+            token_data = client.token_data or None
+        else:
+            token_data = self.config.load_token()
+        is_authenticated = token_data is not None and client is not None
+        
+        if is_authenticated != self._authenticated:
+            self._build_content(is_authenticated)
+        
+        if not is_authenticated:
+            return
+        
+        # Expiry formatting is filled in once the dialog has been shown
+        GLib.idle_add(self._fill_token_validity, token_data,
+                      priority=GLib.PRIORITY_DEFAULT_IDLE)
+        
+        render_key = (token_data.get('expires_at'), client.client_id)
+        if render_key == self._render_key:
+            return
+        self._pending_render_key = render_key
+        
+        cached_user_info = client.get_cached_user_info()
+        if cached_user_info is not None:
+            self._show_user_info_result(cached_user_info, None)
+        else:
+            self._load_user_info_async(client)
+    
+    def _build_content(self, is_authenticated: bool) -> None:
+        """Build the dialog body for the given authentication state."""
+        # Main container (populated detached, attached to the content area last)
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=18)
         main_box.set_halign(Gtk.Align.CENTER)
         main_box.set_size_request(500, -1)
-        box.pack_start(main_box, True, True, 0)
         
-        # Check if authenticated
-        token_data = config.load_token()
-        is_authenticated = token_data is not None and client is not None
+        layout = self._AUTHENTICATED_LAYOUT if is_authenticated else self._NOT_AUTHENTICATED_LAYOUT
+        groups = []
+        for title, description, entries in layout:
+            group = self._create_auth_group(title, description)
+            main_box.pack_start(group, False, False, 0)
+            groups.append((group, self._set_info_rows(group.grid, entries)))
         
         if is_authenticated:
-            account_group = self._create_auth_group(
-                "Account Information",
-                "Microsoft account details"
-            )
-            self._account_group = account_group
-            main_box.pack_start(account_group, False, False, 0)
-            account_group.list_box.add(self._create_info_row("Account", "Loading..."))
-            
-            session_group = self._create_auth_group(
-                "Session Information",
-                "Authentication status"
-            )
-            main_box.pack_start(session_group, False, False, 0)
-            session_group.list_box.add(self._create_info_row("Status", "✓ Authenticated"))
-            session_group.list_box.add(self._create_info_row("Token Validity", self._format_token_validity(token_data)))
-            
-            self.add_button("_Close", Gtk.ResponseType.CLOSE)
-            self._load_user_info_async(client)
-            
+            (self._account_group, _), (_, session_values) = groups
+            self._token_validity_label = session_values[1]
         else:
-            # Not authenticated - show info message
-            not_auth_group = self._create_auth_group(
-                "Not Authenticated",
-                "You are not currently authenticated with OneDrive"
-            )
-            main_box.pack_start(not_auth_group, False, False, 0)
-            
-            info_row = self._create_info_row(
-                "Action Required",
-                "Use Authentication → Login to authenticate with your Microsoft account",
-                wrap=True
-            )
-            not_auth_group.list_box.add(info_row)
-            
-            self.add_button("_Close", Gtk.ResponseType.CLOSE)
+            self._account_group = None
+            self._token_validity_label = None
         
-        self.show_all()
+        box = self.get_content_area()
+        box.freeze_child_notify()
+        if self._main_box is not None:
+            self._main_box.destroy()
+        box.pack_start(main_box, True, True, 0)
+        box.thaw_child_notify()
+        main_box.show_all()
+        
+        self._main_box = main_box
+        self._authenticated = is_authenticated
+        self._render_key = None
     
     def _on_destroy(self, widget) -> None:
         """Track dialog destruction so async callbacks do not update it."""
@@ -165,7 +326,7 @@ class AuthInfoDialog(Gtk.Dialog):
         """Fetch account details off the GTK thread."""
         def load_in_thread():
             try:
-                user_info = client.get_user_info()
+                user_info = client.get_user_info(use_cache=True)
                 GLib.idle_add(self._show_user_info_result, user_info, None)
             except Exception as exc:
                 logger.warning(f"Could not fetch user info: {exc}")
@@ -179,112 +340,109 @@ class AuthInfoDialog(Gtk.Dialog):
         if self._destroyed or self._account_group is None:
             return False
 
-        list_box = self._account_group.list_box
-        for child in list(list_box.get_children()):
-            list_box.remove(child)
-
         if error:
-            list_box.add(self._create_info_row("Status", "⚠ Could not load account details"))
-            list_box.add(self._create_info_row("Details", "Account information is unavailable right now.", wrap=True))
+            rows = [
+                ("Status", "⚠ Could not load account details", False, False),
+                ("Details", "Account information is unavailable right now.", False, True),
+            ]
         else:
-            display_name = user_info.get('displayName') if user_info else None
-            email = None
-            if user_info:
-                email = user_info.get('mail') or user_info.get('userPrincipalName')
+            user_info = user_info or {}
+            display_name = user_info.get('displayName')
+            email = user_info.get('mail') or user_info.get('userPrincipalName')
 
             signed_in_as = display_name or email or "Microsoft account"
-            list_box.add(self._create_info_row("Status", f"Signed in as {html.escape(signed_in_as)}", wrap=True))
+            rows = [("Status", f"Signed in as {signed_in_as}", False, True)]
             if display_name:
-                list_box.add(self._create_info_row("User Name", html.escape(display_name)))
+                rows.append(("User Name", display_name, False, False))
             if email:
-                list_box.add(self._create_info_row("Email", html.escape(email), selectable=True))
+                rows.append(("Email", email, True, False))
+
+        grid = self._account_group.grid
+        self._set_info_rows(grid, rows)
+        grid.show_all()
+        # Errors are retried on the next refresh
+        self._render_key = None if error else self._pending_render_key
+        return False
 
-        list_box.show_all()
+    def _fill_token_validity(self, token_data) -> bool:
+        """Populate the token validity row after the dialog is shown."""
+        if not self._destroyed and self._token_validity_label is not None:
+            self._token_validity_label.set_text(self._format_token_validity(token_data))
         return False
 
     def _format_token_validity(self, token_data) -> str:
         """Return a non-sensitive summary of token validity."""
-        if not token_data or 'expires_at' not in token_data:
+        expires_at = token_data.get('expires_at') if token_data else None
+        if expires_at is None:
             return "Unknown"
 
-        expires_at = token_data['expires_at']
-        expires_datetime = datetime.fromtimestamp(expires_at)
         time_remaining = expires_at - time.time()
+        if time_remaining <= 0:
+            return "Expired (will auto-refresh)"
 
-        if time_remaining > 0:
-            hours = int(time_remaining / 3600)
-            return f"Valid until {expires_datetime.strftime('%Y-%m-%d %H:%M')} ({hours}h remaining)"
-        return "Expired (will auto-refresh)"
+        hours = int(time_remaining / 3600)
+        expires_str = _format_timestamp(int(expires_at), '%Y-%m-%d %H:%M')
+        return f"Valid until {expires_str} ({hours}h remaining)"
 
     def _create_auth_group(self, title: str, description: str) -> Gtk.Box:
         """Create a Libadwaita-style group for authentication dialog."""
-        group_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        
-        # Header
-        header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-        header_box.set_margin_start(12)
+        # Two-column key/value grid: one layout pass instead of a box per row
+        grid = Gtk.Grid(column_spacing=12, row_spacing=24, margin=12)
         
-        title_label = Gtk.Label(label=title)
-        title_label.set_halign(Gtk.Align.START)
-        title_label.get_style_context().add_class("heading")
-        header_box.pack_start(title_label, False, False, 0)
-        
-        desc_label = Gtk.Label(label=description)
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.get_style_context().add_class("dim-label")
-        desc_label.get_style_context().add_class("caption")
-        header_box.pack_start(desc_label, False, False, 0)
-        
-        group_box.pack_start(header_box, False, False, 0)
-        
-        # Boxed list frame
-        frame = Gtk.Frame()
-        frame.set_shadow_type(Gtk.ShadowType.IN)
-        frame.get_style_context().add_class("view")
-        
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        frame.add(list_box)
-        
-        group_box.pack_start(frame, False, False, 0)
-        
-        # Store list_box reference
-        group_box.list_box = list_box
+        group_box = _build_group(title, description, grid)
+        # Store grid reference
+        group_box.grid = grid
         
         return group_box
     
-    def _create_info_row(self, label: str, value: str, selectable: bool = False, wrap: bool = False) -> Gtk.Box:
-        """Create an info row for authentication dialog."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row.set_margin_top(12)
-        row.set_margin_bottom(12)
-        row.set_margin_start(12)
-        row.set_margin_end(12)
-        
-        # Label
-        label_widget = Gtk.Label(label=label)
-        label_widget.set_halign(Gtk.Align.START)
-        label_widget.set_xalign(0)
-        label_widget.set_valign(Gtk.Align.START)
-        label_widget.set_width_chars(15)
-        row.pack_start(label_widget, False, False, 0)
-        
-        # Value
-        value_widget = Gtk.Label(label=value)
-        value_widget.set_halign(Gtk.Align.START)
-        value_widget.set_xalign(0)
-        value_widget.set_selectable(selectable)
-        if wrap:
-            value_widget.set_line_wrap(True)
-            value_widget.set_max_width_chars(50)
-        row.pack_start(value_widget, True, True, 0)
-        
-        return row
+    def _set_info_rows(self, grid: Gtk.Grid, entries) -> List[Gtk.Widget]:
+        """Replace the grid contents with ``(label, value, selectable, wrap)`` entries.
+
+        Selectable values are shown in read-only entries rather than
+        selectable labels.
+
+        Returns:
+            The value widgets, in entry order
+        """
+        for child in grid.get_children():
+            grid.remove(child)
+
+        start = Gtk.Align.START
+        values = []
+        grid.freeze_child_notify()
+        for row, (label, value, selectable, wrap) in enumerate(entries):
+            label_widget = Gtk.Label(label=label, halign=start, valign=start, xalign=0)
+            label_widget.get_style_context().add_class("odsc-kv-label")
+            grid.attach(label_widget, 0, row, 1, 1)
+
+            if selectable:
+                value_widget = _readonly_entry(value)
+            else:
+                value_widget = Gtk.Label(
+                    label=value, halign=start, hexpand=True, xalign=0,
+                    wrap=wrap, max_width_chars=50 if wrap else -1,
+                )
+            grid.attach(value_widget, 1, row, 1, 1)
+            values.append(value_widget)
+        grid.thaw_child_notify()
+        return values
 
 
 class SettingsDialog(Gtk.Dialog):
     """Libadwaita-style preferences dialog using GTK3."""
     
+    # Shared across dialog instances; built on first use
+    _log_level_model: Optional[Gtk.ListStore] = None
+    
+    # (lower, upper, step_increment) for each spin button; only the value
+    # differs between dialog instances
+    _INTERVAL_BOUNDS = (60, 86400, 60)
+    _WORKERS_BOUNDS = (1, 16, 1)
+    _CHUNK_KB_BOUNDS = (4, 16384, 4)
+    
+    # Setting edits are committed together once none has changed for this long
+    _COMMIT_DELAY_MS = 1000
+    
     def __init__(self, parent, config: Config):
         """Initialize dialog."""
         Gtk.Dialog.__init__(self, title="Preferences", transient_for=parent, flags=0)
@@ -298,6 +456,13 @@ class SettingsDialog(Gtk.Dialog):
         # Track if we're initializing to avoid triggering change handlers
         self._initializing = True
         
+        # Debounced setting commits: key -> (commit callback, value), all
+        # flushed by one shared timer
+        self._pending_commits: Dict[str, Tuple[Callable[[Any], Optional[Tuple[str, str]]], Any]] = {}
+        self._commit_source_id = 0
+        # Also emitted (DELETE_EVENT) when the window is closed
+        self.connect("response", self._on_response)
+        
         box = self.get_content_area()
         box.set_spacing(0)
         box.set_margin_top(18)
@@ -305,11 +470,11 @@ class SettingsDialog(Gtk.Dialog):
         box.set_margin_start(24)
         box.set_margin_end(24)
         
-        # Main container (no scrolling needed)
+        # Main container (no scrolling needed); populated detached and
+        # attached to the content area once every row has been built
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=18)
         main_box.set_halign(Gtk.Align.CENTER)
         main_box.set_size_request(540, -1)  # Clamp width like Adw
-        box.pack_start(main_box, True, True, 0)
         
         # Sync Settings Group
         sync_group = self._create_preferences_group(
@@ -327,35 +492,30 @@ class SettingsDialog(Gtk.Dialog):
         dir_button.connect("clicked", self._on_choose_directory)
         dir_button.set_valign(Gtk.Align.CENTER)
         sync_dir_row.pack_end(dir_button, False, False, 0)
-        self.sync_dir_subtitle = sync_dir_row.get_children()[0].get_children()[1]
-        sync_group.add(sync_dir_row)
+        self.sync_dir_subtitle = sync_dir_row.subtitle_label
         
         # Add sync interval row
         interval_row = self._create_action_row(
             "Sync Interval (seconds)",
             "Time between synchronization checks"
         )
-        adjustment = Gtk.Adjustment(value=config.sync_interval, lower=60, upper=86400, step_increment=60)
+        adjustment = self._make_adjustment(config.sync_interval, self._INTERVAL_BOUNDS)
         self.interval_spin = Gtk.SpinButton(adjustment=adjustment)
         self.interval_spin.set_valign(Gtk.Align.CENTER)
         self.interval_spin.connect("value-changed", self._on_interval_changed)
         
         interval_row.pack_end(self.interval_spin, False, False, 0)
-        sync_group.add(interval_row)
         
         # Add parallel workers row
         workers_row = self._create_action_row(
             "Parallel Transfer Workers",
             "Number of files uploaded/downloaded simultaneously"
         )
-        workers_adj = Gtk.Adjustment(
-            value=config.max_sync_workers, lower=1, upper=16, step_increment=1
-        )
+        workers_adj = self._make_adjustment(config.max_sync_workers, self._WORKERS_BOUNDS)
         self.workers_spin = Gtk.SpinButton(adjustment=workers_adj)
         self.workers_spin.set_valign(Gtk.Align.CENTER)
         self.workers_spin.connect("value-changed", self._on_workers_changed)
         workers_row.pack_end(self.workers_spin, False, False, 0)
-        sync_group.add(workers_row)
         
         # Add download chunk size row (displayed in KB, stored as bytes)
         chunk_row = self._create_action_row(
@@ -363,14 +523,15 @@ class SettingsDialog(Gtk.Dialog):
             "Bytes per read when streaming downloads; larger = faster on fast connections"
         )
         chunk_kb = config.download_chunk_size // 1024
-        chunk_adj = Gtk.Adjustment(
-            value=chunk_kb, lower=4, upper=16384, step_increment=4
-        )
+        chunk_adj = self._make_adjustment(chunk_kb, self._CHUNK_KB_BOUNDS)
         self.chunk_spin = Gtk.SpinButton(adjustment=chunk_adj)
         self.chunk_spin.set_valign(Gtk.Align.CENTER)
         self.chunk_spin.connect("value-changed", self._on_chunk_size_changed)
         chunk_row.pack_end(self.chunk_spin, False, False, 0)
-        sync_group.add(chunk_row)
+        
+        _insert_rows(sync_group.list_box, [
+            sync_dir_row, interval_row, workers_row, chunk_row
+        ])
         
         # Application Settings Group
         app_group = self._create_preferences_group(
@@ -385,22 +546,19 @@ class SettingsDialog(Gtk.Dialog):
             "Detail level for log messages"
         )
         
-        self.log_level_combo = Gtk.ComboBoxText()
+        self.log_level_combo = Gtk.ComboBox.new_with_model(self._get_log_level_model())
+        level_renderer = Gtk.CellRendererText()
+        self.log_level_combo.pack_start(level_renderer, True)
+        self.log_level_combo.add_attribute(level_renderer, "text", 0)
         self.log_level_combo.set_valign(Gtk.Align.CENTER)
-        log_level_names = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        for level in log_level_names:
-            self.log_level_combo.append_text(level)
         
         # Set current log level
-        current_level = config.log_level
-        for i, level in enumerate(log_level_names):
-            if level == current_level:
-                self.log_level_combo.set_active(i)
-                break
+        level_index = _LOG_LEVEL_INDEX.get(config.log_level)
+        if level_index is not None:
+            self.log_level_combo.set_active(level_index)
         
         self.log_level_combo.connect("changed", self._on_log_level_changed)
         log_level_row.pack_end(self.log_level_combo, False, False, 0)
-        app_group.add(log_level_row)
         
         # Add splash screen switch row
         splash_row = self._create_switch_row(
@@ -412,45 +570,40 @@ class SettingsDialog(Gtk.Dialog):
         self.splash_switch.set_active(config.show_splash)
         self.splash_switch.connect("notify::active", self._on_show_splash_changed)
         splash_row.pack_end(self.splash_switch, False, False, 0)
-        app_group.add(splash_row)
+        
+        _insert_rows(app_group.list_box, [log_level_row, splash_row])
+        
+        box.freeze_child_notify()
+        box.pack_start(main_box, True, True, 0)
+        box.thaw_child_notify()
         
         # Mark initialization as complete
         self._initializing = False
         
         self.show_all()
     
+    @classmethod
+    def _get_log_level_model(cls) -> Gtk.ListStore:
+        """Return the shared log level model, populating it on first use."""
+        if cls._log_level_model is None:
+            model = Gtk.ListStore(str)
+            for level in LOG_LEVELS:
+                model.append([level])
+            cls._log_level_model = model
+        return cls._log_level_model
+    
+    @staticmethod
+    def _make_adjustment(value: float, bounds) -> Gtk.Adjustment:
+        """Create a spin button adjustment from a ``(lower, upper, step)`` tuple."""
+        lower, upper, step = bounds
+        return Gtk.Adjustment(value=value, lower=lower, upper=upper, step_increment=step)
+    
     def _create_preferences_group(self, title: str, description: str) -> Gtk.Box:
         """Create a Libadwaita-style preferences group (boxed list)."""
-        group_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        
-        # Header
-        header_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-        header_box.set_margin_start(12)
-        
-        title_label = Gtk.Label(label=title)
-        title_label.set_halign(Gtk.Align.START)
-        title_label.get_style_context().add_class("heading")
-        header_box.pack_start(title_label, False, False, 0)
-        
-        desc_label = Gtk.Label(label=description)
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.get_style_context().add_class("dim-label")
-        desc_label.get_style_context().add_class("caption")
-        header_box.pack_start(desc_label, False, False, 0)
-        
-        group_box.pack_start(header_box, False, False, 0)
-        
-        # Boxed list frame
-        frame = Gtk.Frame()
-        frame.set_shadow_type(Gtk.ShadowType.IN)
-        frame.get_style_context().add_class("view")
-        
         list_box = Gtk.ListBox()
         list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        frame.add(list_box)
-        
-        group_box.pack_start(frame, False, False, 0)
         
+        group_box = _build_group(title, description, list_box)
         # Store list_box reference so we can add rows
         group_box.list_box = list_box
         
@@ -458,30 +611,25 @@ class SettingsDialog(Gtk.Dialog):
     
     def _create_action_row(self, title: str, subtitle: str) -> Gtk.Box:
         """Create a Libadwaita-style action row."""
-        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        row.set_margin_top(12)
-        row.set_margin_bottom(12)
-        row.set_margin_start(12)
-        row.set_margin_end(12)
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, margin=12)
         
         # Left side: title and subtitle
-        labels_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-        labels_box.set_valign(Gtk.Align.CENTER)
+        labels_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3,
+                             valign=Gtk.Align.CENTER)
         
-        title_label = Gtk.Label(label=title)
-        title_label.set_halign(Gtk.Align.START)
-        title_label.set_xalign(0)
+        title_label = Gtk.Label(label=title, halign=Gtk.Align.START, xalign=0)
         labels_box.pack_start(title_label, False, False, 0)
         
-        subtitle_label = Gtk.Label(label=subtitle)
-        subtitle_label.set_halign(Gtk.Align.START)
-        subtitle_label.set_xalign(0)
-        subtitle_label.get_style_context().add_class("dim-label")
-        subtitle_label.get_style_context().add_class("caption")
+        subtitle_label = Gtk.Label(label=subtitle, halign=Gtk.Align.START, xalign=0)
+        _add_classes(subtitle_label, ("dim-label", "caption"))
         labels_box.pack_start(subtitle_label, False, False, 0)
         
         row.pack_start(labels_box, True, True, 0)
         
+        # Store label references so callers can update them directly
+        row.title_label = title_label
+        row.subtitle_label = subtitle_label
+        
         return row
     
     def _create_switch_row(self, title: str, subtitle: str) -> Gtk.Box:
@@ -522,117 +670,151 @@ class SettingsDialog(Gtk.Dialog):
                 if DialogHelper.show_restart_prompt(
                     self.parent_window,
                     "Sync Directory Changed",
-                    f"Sync directory changed to:\n{new_dir}\n\n"
-                    "The daemon needs to be restarted for this change to take effect."
+                    f"Sync directory changed to:\n{new_dir}" + _RESTART_TAIL
                 ):
                     self.parent_window._restart_daemon()
                     
             except ValueError as e:
                 # Validation failed
-                DialogHelper.show_error(self.parent_window, f"Invalid sync directory: {e}")
+                DialogHelper.show_error(self.parent_window, "Invalid Setting", f"Invalid sync directory: {e}")
                 # Revert to old value
                 self.sync_dir_subtitle.set_text(str(old_dir))
     
+    def _schedule_commit(
+        self, key: str, commit: Callable[[Any], Optional[Tuple[str, str]]], value: Any
+    ) -> None:
+        """Debounce a setting change.
+        
+        Spin buttons and combo boxes emit changes in rapid bursts, so the
+        latest value of each setting is kept and every pending setting is
+        committed together, with one config save and one restart prompt,
+        once nothing has changed for a second or the dialog closes.
+        """
+        self._pending_commits[key] = (commit, value)
+        if self._commit_source_id:
+            GLib.source_remove(self._commit_source_id)
+        self._commit_source_id = GLib.timeout_add(self._COMMIT_DELAY_MS, self._run_commits)
+    
+    def _run_commits(self) -> bool:
+        """Commit every pending setting change, then save the config once."""
+        self._commit_source_id = 0
+        pending, self._pending_commits = self._pending_commits, {}
+        
+        changes = []
+        for commit, value in pending.values():
+            change = commit(value)
+            if change:
+                changes.append(change)
+        if not changes:
+            return False
+        
+        try:
+            self.config.save()
+        except OSError as e:
+            logger.error(f"Failed to save settings: {e}")
+            DialogHelper.show_error(self.parent_window, "Error", f"Failed to save settings: {e}")
+            return False
+        
+        if len(changes) == 1:
+            title, message = changes[0]
+            message += _RESTART_TAIL
+        else:
+            title = "Settings Changed"
+            message = "\n".join(text for _, text in changes) + _RESTART_TAIL_MANY
+        
+        # Show confirmation with daemon restart option
+        if DialogHelper.show_restart_prompt(self.parent_window, title, message):
+            self.parent_window._restart_daemon()
+        return False
+    
+    def _on_response(self, dialog, response_id) -> None:
+        """Commit any pending setting changes before the dialog closes."""
+        if self._commit_source_id:
+            GLib.source_remove(self._commit_source_id)
+            self._run_commits()
+    
     def _on_interval_changed(self, widget) -> None:
         """Handle sync interval change."""
         if self._initializing:
             return
-            
-        value = int(widget.get_value())
-        
+        self._schedule_commit('sync_interval', self._commit_interval, int(widget.get_value()))
+    
+    def _commit_interval(self, value: int) -> Optional[Tuple[str, str]]:
+        """Apply the sync interval; returns its (title, message) change note."""
         try:
-            self.config.set('sync_interval', value)
-            logger.info(f"Sync interval changed to {value} seconds")
-            
-            # Show confirmation with daemon restart option
-            if DialogHelper.show_restart_prompt(
-                self.parent_window,
-                "Sync Interval Changed",
-                f"Sync interval changed to {value} seconds.\n\n"
-                "The daemon needs to be restarted for this change to take effect."
-            ):
-                self.parent_window._restart_daemon()
-                
+            self.config.set('sync_interval', value, save=False)
         except ValueError as e:
             # Validation failed
-            DialogHelper.show_error(self.parent_window, f"Invalid sync interval: {e}")
+            DialogHelper.show_error(self.parent_window, "Invalid Setting", f"Invalid sync interval: {e}")
             # Revert to old value
             self.interval_spin.set_value(self.config.sync_interval)
+            return None
+        
+        logger.info(f"Sync interval changed to {value} seconds")
+        return "Sync Interval Changed", f"Sync interval changed to {value} seconds."
     
     def _on_workers_changed(self, widget) -> None:
         """Handle parallel transfer workers change."""
         if self._initializing:
             return
+        self._schedule_commit('max_sync_workers', self._commit_workers, int(widget.get_value()))
 
-        value = int(widget.get_value())
-
+    def _commit_workers(self, value: int) -> Optional[Tuple[str, str]]:
+        """Apply the parallel transfer workers setting; returns its change note."""
         try:
-            self.config.set('max_sync_workers', value)
-            logger.info(f"Parallel transfer workers changed to {value}")
-
-            if DialogHelper.show_restart_prompt(
-                self.parent_window,
-                "Workers Setting Changed",
-                f"Parallel transfer workers changed to {value}.\n\n"
-                "The daemon needs to be restarted for this change to take effect."
-            ):
-                self.parent_window._restart_daemon()
-
+            self.config.set('max_sync_workers', value, save=False)
         except ValueError as e:
-            DialogHelper.show_error(self.parent_window, f"Invalid workers value: {e}")
+            DialogHelper.show_error(self.parent_window, "Invalid Setting", f"Invalid workers value: {e}")
             self.workers_spin.set_value(self.config.max_sync_workers)
+            return None
+
+        logger.info(f"Parallel transfer workers changed to {value}")
+        return "Workers Setting Changed", f"Parallel transfer workers changed to {value}."
 
     def _on_chunk_size_changed(self, widget) -> None:
         """Handle download chunk size change (widget value is in KB)."""
         if self._initializing:
             return
+        self._schedule_commit('download_chunk_size', self._commit_chunk_size, int(widget.get_value()))
 
-        kb_value = int(widget.get_value())
+    def _commit_chunk_size(self, kb_value: int) -> Optional[Tuple[str, str]]:
+        """Apply the download chunk size; returns its change note."""
         byte_value = kb_value * 1024
 
         try:
-            self.config.set('download_chunk_size', byte_value)
-            logger.info(f"Download chunk size changed to {byte_value} bytes ({kb_value} KB)")
-
-            if DialogHelper.show_restart_prompt(
-                self.parent_window,
-                "Chunk Size Changed",
-                f"Download chunk size changed to {kb_value} KB.\n\n"
-                "The daemon needs to be restarted for this change to take effect."
-            ):
-                self.parent_window._restart_daemon()
-
+            self.config.set('download_chunk_size', byte_value, save=False)
         except ValueError as e:
-            DialogHelper.show_error(self.parent_window, f"Invalid chunk size: {e}")
+            DialogHelper.show_error(self.parent_window, "Invalid Setting", f"Invalid chunk size: {e}")
             self.chunk_spin.set_value(self.config.download_chunk_size // 1024)
+            return None
+
+        logger.info(f"Download chunk size changed to {byte_value} bytes ({kb_value} KB)")
+        return "Chunk Size Changed", f"Download chunk size changed to {kb_value} KB."
     
     def _on_log_level_changed(self, widget) -> None:
         """Handle log level change."""
         if self._initializing:
             return
         
-        log_level = widget.get_active_text()
-        if log_level:
-            try:
-                # Validate and save to config
-                self.config.set('log_level', log_level)
-                
-                # Apply the log level immediately to GUI
-                setup_logging(level=log_level, log_file=self.config.log_path)
-                logger.info(f"Log level changed to {log_level}")
-                
-                # Show confirmation with daemon restart option
-                if DialogHelper.show_restart_prompt(
-                    self.parent_window,
-                    "Log Level Changed",
-                    f"Log level changed to {log_level}.\n\n"
-                    "The daemon needs to be restarted for this change to take effect."
-                ):
-                    self.parent_window._restart_daemon()
-                    
-            except ValueError as e:
-                # Validation failed
-                DialogHelper.show_error(self.parent_window, f"Invalid log level: {e}")
+        active = widget.get_active()
+        if active >= 0:
+            self._schedule_commit('log_level', self._commit_log_level, LOG_LEVELS[active])
+    
+    def _commit_log_level(self, log_level: str) -> Optional[Tuple[str, str]]:
+        """Apply the log level to the config and the GUI; returns its change note."""
+        try:
+            # Validate and store in config
+            self.config.set('log_level', log_level, save=False)
+        except ValueError as e:
+            # Validation failed
+            DialogHelper.show_error(self.parent_window, "Invalid Setting", f"Invalid log level: {e}")
+            return None
+        
+        # Only the levels change; the handlers and the log file stay open,
+        # so this neither blocks on disk nor races other threads' logging
+        set_log_level(log_level)
+        logger.info(f"Log level changed to {log_level}")
+        return "Log Level Changed", f"Log level changed to {log_level}."
     
     def _on_show_splash_changed(self, widget, _pspec) -> None:
         """Handle show splash screen toggle."""
@@ -654,6 +836,6 @@ class SettingsDialog(Gtk.Dialog):
             )
         except ValueError as e:
             # Validation failed (unlikely for boolean)
-            DialogHelper.show_error(self, f"Failed to save setting: {e}")
+            DialogHelper.show_error(self, "Error", f"Failed to save setting: {e}")
             # Revert
             widget.set_active(self.config.show_splash)
@@ -1,7 +1,6 @@
 """File operation handlers for ODSC GUI."""
 
 import logging
-import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -16,6 +15,9 @@ from .dialogs import DialogHelper
 
 logger = logging.getLogger(__name__)
 
+# Delay before queued file state entries are written to the backend (ms)
+_STATE_FLUSH_DELAY_MS = 500
+
 
 class FileOperationsMixin:
     """Mixin for file download, upload, and remove operations."""
@@ -29,11 +31,131 @@ class FileOperationsMixin:
         correctly interleave with the daemon's own writes.
         """
         if not hasattr(self, "_file_ops_state_mgr"):
-            mgr = SyncStateManager(self.config.load_state, self.config.save_state)
+            mgr = SyncStateManager(
+                self.config.load_state, self.config.save_state, self.config.persist_sync_entry
+            )
             mgr.load()
             self._file_ops_state_mgr = mgr
         return self._file_ops_state_mgr
 
+    @property
+    def _fs_worker(self) -> ThreadPoolExecutor:
+        """Lazily-created single worker for local file removals and state writes.
+
+        Removals run one at a time on a persistent thread instead of a new
+        thread per request, and queued state writes share the same thread so
+        they never run concurrently.
+        """
+        if not hasattr(self, "_file_ops_fs_worker"):
+            self._file_ops_fs_worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="odsc-fs"
+            )
+        return self._file_ops_fs_worker
+
+    @property
+    def _download_pool(self) -> ThreadPoolExecutor:
+        """Lazily-created pool for download jobs.
+
+        Downloads get their own threads so long transfers never hold up
+        the window's refresh executor. Single-file downloads and batch
+        coordinators share it, up to the configured transfer worker count.
+        """
+        if not hasattr(self, "_file_ops_download_pool"):
+            self._file_ops_download_pool = ThreadPoolExecutor(
+                max_workers=self.config.max_sync_workers, thread_name_prefix="odsc-dl"
+            )
+        return self._file_ops_download_pool
+
+    def _queue_state_persist(self, rel_paths) -> None:
+        """Write the given ``files`` entries to the backend shortly.
+
+        Safe to call from worker threads. The in-memory state is already
+        updated; paths queued within ``_STATE_FLUSH_DELAY_MS`` of each other
+        are persisted together as single-row writes on the file-system
+        worker, followed by one tree refresh, instead of rewriting the whole
+        state after every operation.
+
+        Args:
+            rel_paths: Relative paths whose state entries changed
+        """
+        with self._state_lock:
+            pending = getattr(self, "_pending_state_paths", None)
+            if pending is None:
+                pending = self._pending_state_paths = set()
+            pending.update(rel_paths)
+            if not getattr(self, "_state_flush_source_id", 0):
+                self._state_flush_source_id = GLib.timeout_add(
+                    _STATE_FLUSH_DELAY_MS, self._schedule_state_flush
+                )
+
+    def _schedule_state_flush(self) -> bool:
+        """Hand the queued state writes to the file-system worker."""
+        with self._state_lock:
+            self._state_flush_source_id = 0
+        try:
+            self._fs_worker.submit(self._flush_state_writes)
+        except RuntimeError:
+            # Worker already shut down; the window's final flush writes them
+            logger.debug("File-system worker stopped; leaving state writes queued")
+        return False
+
+    def _cancel_state_flush(self) -> None:
+        """Remove a scheduled state flush timer, if any (GTK thread only)."""
+        with self._state_lock:
+            source_id = getattr(self, "_state_flush_source_id", 0)
+            self._state_flush_source_id = 0
+        if source_id:
+            GLib.source_remove(source_id)
+
+    def _flush_state_writes(self, refresh: bool = True) -> None:
+        """Persist every queued ``files`` entry, then refresh the tree.
+
+        The refresh follows the write so the reloaded tree reads the
+        up-to-date state. Call with ``refresh=False`` when shutting down.
+        Entries that fail to persist stay queued for the next flush.
+        """
+        with self._state_lock:
+            paths = getattr(self, "_pending_state_paths", None) or set()
+            self._pending_state_paths = set()
+
+        failed = []
+        for rel_path in paths:
+            try:
+                self._state_mgr.persist_file(rel_path)
+            except Exception as exc:
+                logger.error(f"Failed to save file state for {rel_path}: {exc}", exc_info=True)
+                failed.append(rel_path)
+
+        if failed:
+            # Not rescheduled, so a persistent failure cannot spin; the next
+            # queued write (or the final flush on close) retries them
+            with self._state_lock:
+                self._pending_state_paths.update(failed)
+
+        if refresh:
+            self._request_refresh()
+
+    def _request_refresh(self) -> None:
+        """Schedule one file tree reload and button state update.
+
+        Safe to call from worker threads. Requests made before the scheduled
+        refresh runs are coalesced, so N finished operations trigger a single
+        reload instead of N.
+        """
+        with self._state_lock:
+            if getattr(self, "_refresh_pending", False):
+                return
+            self._refresh_pending = True
+        GLib.idle_add(self._run_requested_refresh)
+
+    def _run_requested_refresh(self) -> bool:
+        """Run the refresh scheduled by :meth:`_request_refresh`."""
+        with self._state_lock:
+            self._refresh_pending = False
+        self._load_remote_files()
+        self._update_button_states()
+        return False
+
     def _on_keep_local_clicked(self, widget) -> None:
         """Handle keep local copy button click."""
         selection = self.file_tree.get_selection()
@@ -46,28 +168,20 @@ class FileOperationsMixin:
         
         for path in paths:
             tree_iter = model.get_iter(path)
-            is_folder = model.get_value(tree_iter, 6)
+            is_folder, file_id, is_local, file_name = model.get(tree_iter, 6, 5, 4, 1)
             
             if is_folder:
                 files_to_download.extend(self._get_all_files_in_folder(model, tree_iter))
-            else:
-                file_id = model.get_value(tree_iter, 5)
-                is_local = model.get_value(tree_iter, 4)
-                file_name = model.get_value(tree_iter, 1)
-                
-                if not is_local and file_id:
-                    files_to_download.append((file_id, file_name))
+            elif not is_local and file_id:
+                files_to_download.append((file_id, file_name))
         
         if not files_to_download:
             return
         
-        if len(files_to_download) > 10:
+        if len(files_to_download) > 1:
             self._download_files_batch(files_to_download)
         else:
-            for file_id, file_name in files_to_download:
-                self._download_file(file_id, file_name)
-            
-            GLib.timeout_add(500, self._update_button_states)
+            self._download_file(*files_to_download[0])
     
     def _on_remove_local_clicked(self, widget) -> None:
         """Handle remove local copy button click."""
@@ -81,17 +195,12 @@ class FileOperationsMixin:
         
         for path in paths:
             tree_iter = model.get_iter(path)
-            is_folder = model.get_value(tree_iter, 6)
+            is_folder, file_path_str, is_local, file_name = model.get(tree_iter, 6, 7, 4, 1)
             
             if is_folder:
                 files_to_remove.extend(self._get_all_files_in_folder_for_removal(model, tree_iter))
-            else:
-                file_path_str = model.get_value(tree_iter, 7)
-                is_local = model.get_value(tree_iter, 4)
-                file_name = model.get_value(tree_iter, 1)
-                
-                if is_local:
-                    files_to_remove.append((file_path_str, file_name))
+            elif is_local:
+                files_to_remove.append((file_path_str, file_name))
         
         if not files_to_remove:
             return
@@ -110,12 +219,13 @@ class FileOperationsMixin:
             self._remove_local_files_batch(files_to_remove)
         else:
             self._remove_local_file(*files_to_remove[0])
-        
-        GLib.timeout_add(500, self._update_button_states)
     
     def _get_all_files_in_folder(self, model, folder_iter):
         """Get all files in a folder recursively for downloading.
         
+        Subfolders whose cached stats show no remote-only files are skipped
+        without being walked.
+        
         Args:
             model: TreeModel
             folder_iter: TreeIter for the folder
@@ -124,30 +234,36 @@ class FileOperationsMixin:
             List of tuples (file_id, file_name) for files that aren't local
         """
         files = []
+        stats_cache = self._folder_stats_cache
         
-        def collect_files(parent_iter):
+        stack = [(folder_iter, model.get_value(folder_iter, 7))]
+        while stack:
+            parent_iter, folder_path = stack.pop()
+            stats = stats_cache.get(folder_path)
+            if stats is not None and stats[2] == 0:
+                continue
+            
             child_iter = model.iter_children(parent_iter)
             while child_iter:
-                is_folder = model.get_value(child_iter, 6)
+                is_folder, file_id, is_local, file_name, file_path_str = model.get(
+                    child_iter, 6, 5, 4, 1, 7
+                )
                 
                 if is_folder:
-                    collect_files(child_iter)
-                else:
-                    file_id = model.get_value(child_iter, 5)
-                    is_local = model.get_value(child_iter, 4)
-                    file_name = model.get_value(child_iter, 1)
-                    
-                    if not is_local and file_id:
-                        files.append((file_id, file_name))
+                    stack.append((child_iter, file_path_str))
+                elif not is_local and file_id:
+                    files.append((file_id, file_name))
                 
                 child_iter = model.iter_next(child_iter)
         
-        collect_files(folder_iter)
         return files
     
     def _get_all_files_in_folder_for_removal(self, model, folder_iter):
         """Get all files in a folder recursively for removal.
         
+        Subfolders whose cached stats show no local files are skipped
+        without being walked.
+        
         Args:
             model: TreeModel
             folder_iter: TreeIter for the folder
@@ -156,25 +272,26 @@ class FileOperationsMixin:
             List of tuples (file_path, file_name) for files that are local
         """
         files = []
+        stats_cache = self._folder_stats_cache
         
-        def collect_files(parent_iter):
+        stack = [(folder_iter, model.get_value(folder_iter, 7))]
+        while stack:
+            parent_iter, folder_path = stack.pop()
+            stats = stats_cache.get(folder_path)
+            if stats is not None and stats[1] == 0:
+                continue
+            
             child_iter = model.iter_children(parent_iter)
             while child_iter:
-                is_folder = model.get_value(child_iter, 6)
+                is_folder, file_path_str, is_local, file_name = model.get(child_iter, 6, 7, 4, 1)
                 
                 if is_folder:
-                    collect_files(child_iter)
-                else:
-                    file_path_str = model.get_value(child_iter, 7)
-                    is_local = model.get_value(child_iter, 4)
-                    file_name = model.get_value(child_iter, 1)
-                    
-                    if is_local:
-                        files.append((file_path_str, file_name))
+                    stack.append((child_iter, file_path_str))
+                elif is_local:
+                    files.append((file_path_str, file_name))
                 
                 child_iter = model.iter_next(child_iter)
         
-        collect_files(folder_iter)
         return files
     
     def _remove_local_file(self, rel_path: str, file_name: str) -> None:
@@ -195,11 +312,10 @@ class FileOperationsMixin:
                 cleanup_empty_parent_dirs(local_path, self.config.sync_directory)
                 
                 with self._state_lock:
-                    self._state_mgr.mark_file_not_downloaded(rel_path)
-                    self._state_mgr.save()
+                    tracked = self._state_mgr.mark_file_not_downloaded(rel_path)
                 
                 GLib.idle_add(self._update_status, f"Removed local copy of {file_name}")
-                GLib.idle_add(self._load_remote_files)
+                self._queue_state_persist([rel_path] if tracked else [])
                 
             except Exception as exc:
                 log_exception(logger, f"Failed to remove local copy of {file_name}", exc, exc_info=True)
@@ -209,13 +325,12 @@ class FileOperationsMixin:
                     user_friendly_error("remove the local copy", exc, item_type="file"),
                 )
         
-        thread = threading.Thread(target=remove_in_thread, daemon=True)
-        thread.start()
+        self._fs_worker.submit(remove_in_thread)
 
     def _remove_local_files_batch(self, files: list) -> None:
-        """Remove local copies of multiple files in a single background thread.
+        """Remove local copies of multiple files in a single background task.
 
-        Spawns one worker thread, deletes all files, then does a single atomic
+        Runs on the file-system worker, deletes all files, then does a single atomic
         state save and a single UI refresh — avoiding the per-file thread storm
         that caused the GTK main thread to freeze on large selections.
 
@@ -248,14 +363,12 @@ class FileOperationsMixin:
                     )
                     error_count += 1
 
-            # Single atomic state update + save
-            try:
-                with self._state_lock:
-                    for rel_path in not_downloaded_paths:
-                        self._state_mgr.mark_file_not_downloaded(rel_path)
-                    self._state_mgr.save()
-            except Exception as exc:
-                logger.error(f"Failed to save state after batch remove: {exc}", exc_info=True)
+            # Single in-memory state update; the queued write persists it
+            with self._state_lock:
+                changed_paths = [
+                    rel_path for rel_path in not_downloaded_paths
+                    if self._state_mgr.mark_file_not_downloaded(rel_path)
+                ]
 
             if error_count > 0:
                 GLib.idle_add(
@@ -270,12 +383,10 @@ class FileOperationsMixin:
             else:
                 GLib.idle_add(self._update_status, f"Removed all {total} local files")
 
-            # Single UI refresh at the end
-            GLib.idle_add(self._load_remote_files)
-            GLib.idle_add(self._update_button_states)
+            # Single state write and UI refresh at the end
+            self._queue_state_persist(changed_paths)
 
-        thread = threading.Thread(target=remove_batch, daemon=True)
-        thread.start()
+        self._fs_worker.submit(remove_batch)
 
     def _download_file(self, file_id: str, file_name: str) -> None:
         """Download file from OneDrive.
@@ -312,11 +423,10 @@ class FileOperationsMixin:
                         size=file_info.get('size', 0),
                         metadata=metadata,
                     )
-                    self._state_mgr.save()
                 
                 logger.info(f"Downloaded and marked for sync: {rel_path}")
                 GLib.idle_add(self._update_status, f"Downloaded {file_name}")
-                GLib.idle_add(self._load_remote_files)
+                self._queue_state_persist([rel_path])
             except Exception as exc:
                 log_exception(logger, f"Failed to download {file_name}", exc, exc_info=True)
                 GLib.idle_add(
@@ -326,8 +436,7 @@ class FileOperationsMixin:
                 )
                 GLib.idle_add(self._update_status, f"Download failed: {file_name}")
         
-        thread = threading.Thread(target=download_in_thread, daemon=True)
-        thread.start()
+        self._download_pool.submit(download_in_thread)
     
     def _download_files_batch(self, files: list) -> None:
         """Download multiple files in parallel using a thread pool.
@@ -385,13 +494,9 @@ class FileOperationsMixin:
                         log_exception(logger, f"Failed to download {file_name}", exc, exc_info=True)
                         error_count += 1
             
-            try:
-                with self._state_lock:
-                    self._state_mgr.patch_file_entries(state_updates)
-                    self._state_mgr.save()
-                logger.info(f"Batch download complete: {success_count} succeeded, {error_count} failed")
-            except Exception as exc:
-                logger.error(f"Failed to save state after batch download: {exc}", exc_info=True)
+            with self._state_lock:
+                self._state_mgr.patch_file_entries(state_updates)
+            logger.info(f"Batch download complete: {success_count} succeeded, {error_count} failed")
             
             if error_count > 0:
                 GLib.idle_add(
@@ -406,8 +511,6 @@ class FileOperationsMixin:
             else:
                 GLib.idle_add(self._update_status, f"Downloaded all {total} files successfully")
             
-            GLib.idle_add(self._load_remote_files)
-            GLib.idle_add(self._update_button_states)
+            self._queue_state_persist(state_updates)
         
-        thread = threading.Thread(target=download_batch, daemon=True)
-        thread.start()
+        self._download_pool.submit(download_batch)
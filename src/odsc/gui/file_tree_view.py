@@ -10,18 +10,39 @@ from gi.repository import Gtk, GLib, Gio
 
 logger = logging.getLogger(__name__)
 
+# Every file_store column, in order: icon, name, size, modified, is_local,
+# file_id, is_folder, path, error
+_ROW_COLUMNS = list(range(9))
+
+# Status icon per folder sync status; 'empty' folders get no icon
+_FOLDER_STATUS_ICONS = {
+    'all': 'emblem-default',
+    'partial': 'emblem-dropbox-selsync',
+    'none': 'weather-overcast',
+}
+
+# File icon names keyed by extension (or by the whole name when there is none)
+_icon_cache: Dict[str, str] = {}
+
 
 class FileTreeViewMixin:
     """Mixin for file tree view logic, sorting, and tooltips."""
     
     def _init_tree_view_cache(self):
         """Initialize caches for tree view optimizations."""
-        self._folder_status_cache = {}
+        # folder path -> (total_files, synced_files, remote_only_files)
+        self._folder_stats_cache = {}
+        self._last_selection_sig = None
+        # folder path -> TreeIter, filled while the file list is built
+        self._folder_iters = {}
         self._pending_uploads_scanned = False
+        # (sort_column, sort_order) saved while a rebuild has sorting off
+        self._suspended_sort = None
     
     def _clear_tree_view_cache(self):
         """Clear all tree view caches."""
-        self._folder_status_cache = {}
+        self._folder_stats_cache = {}
+        self._last_selection_sig = None
     
     def _render_status_icon(self, column, cell, model, iter, data):
         """Render OneDrive-style status icon.
@@ -33,22 +54,14 @@ class FileTreeViewMixin:
             iter: TreeIter
             data: User data
         """
-        is_local = model.get_value(iter, 4)
-        is_folder = model.get_value(iter, 6)
-        file_name = model.get_value(iter, 1)
-        error_msg = model.get_value(iter, 8)
-        
-        if is_folder:
+        if model.get_value(iter, 6):
+            # Folder status comes from the shared per-folder stats cache
             folder_status = self._get_folder_sync_status(model, iter)
-            if folder_status == 'all':
-                cell.set_property('icon-name', 'emblem-default')
-            elif folder_status == 'partial':
-                cell.set_property('icon-name', 'emblem-dropbox-selsync')
-            elif folder_status == 'none':
-                cell.set_property('icon-name', 'weather-overcast')
-            else:
-                cell.set_property('icon-name', None)
-        elif error_msg:
+            cell.set_property('icon-name', _FOLDER_STATUS_ICONS.get(folder_status))
+            return
+        
+        error_msg, file_name, is_local = model.get(iter, 8, 1, 4)
+        if error_msg:
             cell.set_property('icon-name', 'dialog-error')
         elif "(pending upload)" in file_name:
             cell.set_property('icon-name', 'emblem-synchronizing')
@@ -84,15 +97,12 @@ class FileTreeViewMixin:
         model = widget.get_model()
         tree_iter = model.get_iter(path)
         
-        is_local = model.get_value(tree_iter, 4)
-        is_folder = model.get_value(tree_iter, 6)
-        file_name = model.get_value(tree_iter, 1)
-        error_msg = model.get_value(tree_iter, 8)
+        is_local, is_folder, file_name, error_msg = model.get(tree_iter, 4, 6, 1, 8)
         
         tooltip_text = None
         
         if is_folder:
-            folder_status = self._get_folder_sync_status_cached(model, tree_iter)
+            folder_status = self._get_folder_sync_status(model, tree_iter)
             if folder_status == 'all':
                 tooltip_text = 'All files synced - All files in this folder are available locally'
             elif folder_status == 'partial':
@@ -116,24 +126,6 @@ class FileTreeViewMixin:
         
         return False
     
-    def _get_folder_sync_status_cached(self, model, folder_iter):
-        """Get cached sync status of a folder.
-        
-        Args:
-            model: TreeModel
-            folder_iter: TreeIter for the folder
-            
-        Returns:
-            'all', 'partial', 'none', or 'empty'
-        """
-        file_path = model.get_value(folder_iter, 7)
-        if file_path in self._folder_status_cache:
-            return self._folder_status_cache[file_path]
-        
-        status = self._get_folder_sync_status(model, folder_iter)
-        self._folder_status_cache[file_path] = status
-        return status
-    
     def _get_folder_sync_status(self, model, folder_iter):
         """Get sync status of all files in a folder (recursively).
         
@@ -145,27 +137,8 @@ class FileTreeViewMixin:
             'all' if all files are synced, 'partial' if some are synced, 
             'none' if no files are synced, 'empty' if no files in folder
         """
-        total_files = 0
-        synced_files = 0
-        
-        def count_files(parent_iter):
-            nonlocal total_files, synced_files
-            
-            child_iter = model.iter_children(parent_iter)
-            while child_iter:
-                is_folder = model.get_value(child_iter, 6)
-                
-                if is_folder:
-                    count_files(child_iter)
-                else:
-                    total_files += 1
-                    is_local = model.get_value(child_iter, 4)
-                    if is_local:
-                        synced_files += 1
-                
-                child_iter = model.iter_next(child_iter)
-        
-        count_files(folder_iter)
+        # Cached per folder, so the per-row status icon renderer stays cheap
+        total_files, synced_files, _ = self._walk_folder_stats(model, folder_iter)
         
         if total_files == 0:
             return 'empty'
@@ -176,12 +149,76 @@ class FileTreeViewMixin:
         else:
             return 'none'
     
+    def _walk_folder_stats(self, model, folder_iter):
+        """Count the files under a folder in a single depth-first walk.
+        
+        Results are cached per folder path, including every subfolder
+        visited on the way, until the tree view caches are cleared. Folder
+        status icons, tooltips and button states all share these counts.
+        
+        Args:
+            model: TreeModel
+            folder_iter: TreeIter for the folder
+            
+        Returns:
+            Tuple of (total_files, synced_files, remote_only_files)
+        """
+        cache = self._folder_stats_cache
+        root_path = model.get_value(folder_iter, 7)
+        cached = cache.get(root_path)
+        if cached is not None:
+            return cached
+        
+        # Explicit stack of [folder_path, next_child_iter, total, synced,
+        # remote_only]; a folder's counts are folded into its parent's frame
+        # once all of its children have been visited.
+        stack = [[root_path, model.iter_children(folder_iter), 0, 0, 0]]
+        while True:
+            frame = stack[-1]
+            child_iter = frame[1]
+            
+            if child_iter is None:
+                stack.pop()
+                stats = (frame[2], frame[3], frame[4])
+                cache[frame[0]] = stats
+                if not stack:
+                    return stats
+                parent = stack[-1]
+                parent[2] += stats[0]
+                parent[3] += stats[1]
+                parent[4] += stats[2]
+                continue
+            
+            frame[1] = model.iter_next(child_iter)
+            is_local, file_id, is_folder, path = model.get(child_iter, 4, 5, 6, 7)
+            
+            if is_folder:
+                sub_stats = cache.get(path)
+                if sub_stats is None:
+                    stack.append([path, model.iter_children(child_iter), 0, 0, 0])
+                    continue
+                frame[2] += sub_stats[0]
+                frame[3] += sub_stats[1]
+                frame[4] += sub_stats[2]
+            else:
+                frame[2] += 1
+                if is_local:
+                    frame[3] += 1
+                elif file_id:
+                    frame[4] += 1
+    
     def _on_selection_changed(self, selection) -> None:
         """Handle selection changed event.
         
         Args:
             selection: TreeSelection object
         """
+        # Cursor and focus changes re-emit "changed" for the same selection
+        _, paths = selection.get_selected_rows()
+        signature = frozenset(tuple(path.get_indices()) for path in paths)
+        if signature == self._last_selection_sig:
+            return
+        self._last_selection_sig = signature
         self._update_button_states()
     
     def _on_tree_button_press(self, widget, event) -> bool:
@@ -207,9 +244,7 @@ class FileTreeViewMixin:
         
         for path in paths:
             tree_iter = model.get_iter(path)
-            is_local = model.get_value(tree_iter, 4)
-            is_folder = model.get_value(tree_iter, 6)
-            file_id = model.get_value(tree_iter, 5)
+            is_local, is_folder, file_id = model.get(tree_iter, 4, 6, 5)
             
             if is_folder:
                 folder_local, folder_remote = self._count_folder_files(model, tree_iter)
@@ -234,47 +269,32 @@ class FileTreeViewMixin:
         Returns:
             Tuple of (local_count, remote_only_count)
         """
-        local_count = 0
-        remote_only_count = 0
-        
-        def count_files(parent_iter):
-            nonlocal local_count, remote_only_count
-            
-            child_iter = model.iter_children(parent_iter)
-            while child_iter:
-                is_folder = model.get_value(child_iter, 6)
-                
-                if is_folder:
-                    count_files(child_iter)
-                else:
-                    is_local = model.get_value(child_iter, 4)
-                    file_id = model.get_value(child_iter, 5)
-                    
-                    if is_local:
-                        local_count += 1
-                    elif file_id:
-                        remote_only_count += 1
-                
-                child_iter = model.iter_next(child_iter)
-        
-        count_files(folder_iter)
+        _, local_count, remote_only_count = self._walk_folder_stats(model, folder_iter)
         return local_count, remote_only_count
     
     def _save_expanded_state(self):
         """Save the list of expanded tree paths.
         
+        Only descends into expanded folders: rows under a collapsed folder
+        cannot be expanded themselves, so they are never visited.
+        
         Returns:
             Set of expanded path tuples
         """
         expanded = set()
+        model = self.file_store
+        tree = self.file_tree
         
-        def check_row(model, path, iter):
-            if self.file_tree.row_expanded(path):
-                file_path = model.get_value(iter, 7)
-                if file_path:
-                    expanded.add(file_path)
-        
-        self.file_store.foreach(check_row)
+        stack = [model.iter_children(None)]
+        while stack:
+            child_iter = stack.pop()
+            while child_iter:
+                is_folder, file_path = model.get(child_iter, 6, 7)
+                if is_folder and tree.row_expanded(model.get_path(child_iter)):
+                    if file_path:
+                        expanded.add(file_path)
+                    stack.append(model.iter_children(child_iter))
+                child_iter = model.iter_next(child_iter)
         return expanded
     
     def _save_scroll_position(self):
@@ -300,12 +320,23 @@ class FileTreeViewMixin:
             self.file_tree.expand_row(Gtk.TreePath.new_first(), False)
             return
         
-        def expand_row(model, path, iter):
-            file_path = model.get_value(iter, 7)
-            if file_path in expanded_paths:
-                self.file_tree.expand_row(path, False)
+        folder_iters = self._folder_iters
+        if not folder_iters:
+            def expand_row(model, path, iter):
+                file_path = model.get_value(iter, 7)
+                if file_path in expanded_paths:
+                    self.file_tree.expand_row(path, False)
+            
+            self.file_store.foreach(expand_row)
+            return
         
-        self.file_store.foreach(expand_row)
+        # Resolve the saved folders through the path -> iter map instead of
+        # walking every row; parents go first so children are reachable
+        model = self.file_store
+        for file_path in sorted(expanded_paths, key=lambda p: p.count('/')):
+            tree_iter = folder_iters.get(file_path)
+            if tree_iter is not None:
+                self.file_tree.expand_row(model.get_path(tree_iter), False)
     
     def _restore_scroll_position(self, position):
         """Restore scroll position.
@@ -401,6 +432,55 @@ class FileTreeViewMixin:
         if pending_count > 0:
             logger.info(f"Found {pending_count} files pending upload")
     
+    def _suspend_tree_updates(self) -> None:
+        """Detach the store from the view and switch off sorting for a rebuild.
+        
+        Rows appended while detached emit no signals to the view and trigger
+        no resorts. :meth:`_resume_tree_updates` undoes both.
+        """
+        if self.file_tree.get_model() is None:
+            return  # A rebuild already in progress suspended updates
+        self.file_tree.freeze_child_notify()
+        self.file_tree.set_model(None)
+        self._suspend_sort()
+    
+    def _resume_tree_updates(self) -> None:
+        """Restore sorting and reattach the store after :meth:`_suspend_tree_updates`."""
+        if self.file_tree.get_model() is not None:
+            return
+        self._restore_sort()
+        self.file_tree.set_model(self.file_store)
+        self.file_tree.thaw_child_notify()
+    
+    def _suspend_sort(self) -> None:
+        """Switch the store to unsorted, remembering the sort to restore."""
+        store = self.file_store
+        if self._suspended_sort is None:
+            self._suspended_sort = store.get_sort_column_id()
+            store.set_sort_column_id(Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID,
+                                     Gtk.SortType.ASCENDING)
+    
+    def _insert_row(self, parent_iter, values):
+        """Append a row under ``parent_iter`` with every column set at once.
+        
+        insert_with_values fills all columns in C and emits a single
+        row-inserted, skipping the per-column Python conversion that
+        TreeStore.append() does.
+        
+        Returns:
+            TreeIter for the new row
+        """
+        return self.file_store.insert_with_values(parent_iter, -1, _ROW_COLUMNS, values)
+    
+    def _restore_sort(self) -> None:
+        """Restore the sort order suspended by :meth:`_suspend_sort`."""
+        saved_sort = self._suspended_sort
+        self._suspended_sort = None
+        if saved_sort is not None:
+            sort_column, sort_order = saved_sort
+            if sort_column is not None:
+                self.file_store.set_sort_column_id(sort_column, sort_order)
+    
     def _get_file_icon(self, filename: str) -> str:
         """Get icon name for file type using GIO content type detection.
         
@@ -410,9 +490,20 @@ class FileTreeViewMixin:
         Returns:
             GTK icon name
         """
+        # Content type guessing only looks at the name, so results repeat
+        # per extension; MIME globs can be case-sensitive, so keep the case
+        stem, dot, ext = filename.rpartition('.')
+        key = '.' + ext if dot and stem else filename
+        icon_name = _icon_cache.get(key)
+        if icon_name is not None:
+            return icon_name
+        
+        icon_name = 'text-x-generic'
         content_type, _ = Gio.content_type_guess(filename, None)
         if content_type:
             icon = Gio.content_type_get_icon(content_type)
             names = icon.get_names() if hasattr(icon, 'get_names') else []
-            return names[0] if names else 'text-x-generic'
-        return 'text-x-generic'
+            if names:
+                icon_name = names[0]
+        _icon_cache[key] = icon_name
+        return icon_name
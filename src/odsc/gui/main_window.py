@@ -1,8 +1,11 @@
 """Main window for ODSC GUI."""
 
-import html
+import codecs
 import logging
+import os
+import re
 import threading
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from concurrent.futures import ThreadPoolExecutor
@@ -15,16 +18,34 @@ from ..config import Config
 from ..error_handling import log_exception, user_friendly_error
 from ..onedrive_client import OneDriveClient
 from ..logging_config import setup_logging
-from ..path_utils import sanitize_onedrive_path, validate_sync_path, SecurityError
+from ..path_utils import (
+    sanitize_onedrive_path, split_parent, validate_sync_child, validate_sync_path, SecurityError,
+)
 from ..services.file_cache_service import FileCacheService
 from .daemon_controller import DaemonController
-from .dialogs import DialogHelper
+from .dialogs import DialogHelper, AuthInfoDialog
 from .menu_bar import MenuBarMixin
 from .file_tree_view import FileTreeViewMixin
 from .file_operations import FileOperationsMixin
 
 logger = logging.getLogger(__name__)
 
+# Time spent inserting file tree rows per main-loop iteration (µs)
+_ROW_BATCH_BUDGET_US = 8000
+
+_needs_escape = re.compile(r"[&<>\"']").search
+
+
+def _escape_markup(text: str) -> str:
+    """Escape text for Pango markup, returning clean strings unchanged.
+    
+    Produces the same output as ``html.escape(text)``.
+    """
+    if not _needs_escape(text):
+        return text
+    return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;").replace("'", "&#x27;"))
+
 
 class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.ApplicationWindow):
     """Main GNOME GUI window for OneDrive Sync Client."""
@@ -52,10 +73,15 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         self.remote_files: List[Dict[str, Any]] = []
         
         self.executor = ThreadPoolExecutor(max_workers=2)
+        # Whether a file list load (fetch plus render) is in flight, and
+        # whether another was requested meanwhile
+        self._refresh_in_progress = False
+        self._refresh_queued = False
         self.connect("destroy", self._on_destroy)
         
         self.login_menu_item: Optional[Gtk.MenuItem] = None
         self.logout_menu_item: Optional[Gtk.MenuItem] = None
+        self._auth_dialog: Optional[AuthInfoDialog] = None
         
         self.log_panel_visible = False
         self.log_text_view: Optional[Gtk.TextView] = None
@@ -63,12 +89,16 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         self.main_paned: Optional[Gtk.Paned] = None
         self.log_file_position = 0
         self.log_tail_timer_id = None
+        # Log file descriptor kept open while the log panel is tailing
+        self._log_fd: Optional[int] = None
+        self._log_decoder = None
         
         self._init_tree_view_cache()
         
         if self.config.load_token():
             logger.info("Found existing token, initializing client")
             self._init_client()
+            self._prefetch_user_info()
         else:
             logger.info("No existing token found")
         
@@ -89,9 +119,38 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             self.client = OneDriveClient(client_id, token_data)
         return True
 
+    def _prefetch_user_info(self) -> None:
+        """Warm the client's user profile cache in the background.
+        
+        This lets the authentication dialog show account details from memory
+        instead of waiting on Microsoft Graph when it is first opened.
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        
+        def prefetch():
+            try:
+                client.get_user_info(use_cache=True)
+            except Exception as e:
+                logger.debug(f"User info prefetch failed: {e}")
+        
+        self.executor.submit(prefetch)
+
     def _on_destroy(self, widget) -> None:
         """Release background resources when the window is destroyed."""
         self.executor.shutdown(wait=False)
+        # Let in-flight removals and state flushes finish, then write any
+        # still-debounced file state here, with nothing else writing it
+        fs_worker = getattr(self, "_file_ops_fs_worker", None)
+        if fs_worker is not None:
+            fs_worker.shutdown(wait=True)
+        self._cancel_state_flush()
+        self._flush_state_writes(refresh=False)
+        self._close_log_fd()
+        download_pool = getattr(self, "_file_ops_download_pool", None)
+        if download_pool is not None:
+            download_pool.shutdown(wait=False)
 
     def _get_client(self) -> Optional[OneDriveClient]:
         """Return the current client reference safely."""
@@ -109,9 +168,12 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             self.config.save_state(state)
 
     def _set_remote_files(self, files: List[Dict[str, Any]]) -> None:
-        """Replace cached remote files safely."""
+        """Replace cached remote files safely.
+        
+        Takes ownership of ``files``; callers hand over a freshly built list.
+        """
         with self._state_lock:
-            self.remote_files = list(files)
+            self.remote_files = files
 
     def _get_remote_file_count(self) -> int:
         """Return the cached remote file count safely."""
@@ -167,10 +229,8 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             -1 if iter1 < iter2, 0 if equal, 1 if iter1 > iter2
         """
         # Column 1 is name, Column 6 is is_folder
-        name1 = model.get_value(iter1, 1)
-        name2 = model.get_value(iter2, 1)
-        is_folder1 = model.get_value(iter1, 6)
-        is_folder2 = model.get_value(iter2, 6)
+        name1, is_folder1 = model.get(iter1, 1, 6)
+        name2, is_folder2 = model.get(iter2, 1, 6)
         
         # Remove " (pending upload)" suffix for sorting
         name1_clean = name1.replace(" (pending upload)", "")
@@ -322,7 +382,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         
         log_label = Gtk.Label()
         # Escape path to prevent Pango markup injection
-        log_label.set_markup(f"<b>Log: {html.escape(str(self.config.log_path))}</b>")
+        log_label.set_markup(f"<b>Log: {_escape_markup(str(self.config.log_path))}</b>")
         log_label.set_halign(Gtk.Align.START)
         header_box.pack_start(log_label, True, True, 0)
         
@@ -374,6 +434,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             if self.log_tail_timer_id:
                 GLib.source_remove(self.log_tail_timer_id)
                 self.log_tail_timer_id = None
+            self._close_log_fd()
             
             self.main_paned.remove(self.log_panel)
             self.log_panel_visible = False
@@ -384,57 +445,91 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         self._refresh_log_content()
     
     def _refresh_log_content(self) -> None:
-        """Refresh the log content from file (full reload)."""
+        """Refresh the log content from file (full reload).
+        
+        Reopens the log, so this also picks up a rotated or truncated file.
+        """
+        self._close_log_fd()
+        self.log_file_position = 0
+        buffer = self.log_text_view.get_buffer()
         log_path = self.config.log_path
         
         if not log_path.exists():
-            buffer = self.log_text_view.get_buffer()
             buffer.set_text("Log file does not exist yet.\n")
-            self.log_file_position = 0
             return
         
         try:
-            with open(log_path, 'r') as f:
-                log_content = f.read()
-                self.log_file_position = f.tell()
-            
-            buffer = self.log_text_view.get_buffer()
-            buffer.set_text(log_content)
+            self._log_fd = os.open(log_path, os.O_RDONLY)
+            self._log_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            buffer.set_text(self._read_log_delta() or "")
             
             if self.auto_scroll_check.get_active():
                 GLib.idle_add(self._scroll_log_to_end)
                 
         except Exception as e:
-            buffer = self.log_text_view.get_buffer()
-            buffer.set_text(f"Error reading log file: {e}\n")
+            self._close_log_fd()
             self.log_file_position = 0
+            buffer.set_text(f"Error reading log file: {e}\n")
+    
+    def _read_log_delta(self) -> Optional[str]:
+        """Read whatever was appended to the open log since the last read.
+        
+        Returns:
+            The new text ('' if the log has not grown), or None if the file
+            shrank and needs a full reload
+        """
+        size = os.fstat(self._log_fd).st_size
+        if size == self.log_file_position:
+            return ''
+        if size < self.log_file_position:
+            return None
+        
+        data = os.pread(self._log_fd, size - self.log_file_position, self.log_file_position)
+        self.log_file_position += len(data)
+        return self._log_decoder.decode(data)
+    
+    def _log_rotated(self) -> bool:
+        """Check whether the log path now names a different file than the open one."""
+        try:
+            return os.stat(self.config.log_path).st_ino != os.fstat(self._log_fd).st_ino
+        except FileNotFoundError:
+            return False  # Mid-rotation; check again on the next tick
+    
+    def _close_log_fd(self) -> None:
+        """Close the tailed log file descriptor, if open."""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+            self._log_decoder = None
     
     def _tail_log_file(self) -> bool:
         """Tail the log file (read only new content).
         
+        The log stays open between ticks, so an idle tick costs a single
+        fstat; the path is only re-checked for rotation when nothing new
+        was read.
+        
         Returns:
             True to continue the timer, False to stop
         """
-        log_path = self.config.log_path
-        
-        if not log_path.exists():
+        if self._log_fd is None:
+            # Log did not exist (or failed to open) at the last full load
+            if self.config.log_path.exists():
+                self._refresh_log_content()
             return True
         
         try:
-            with open(log_path, 'r') as f:
-                f.seek(self.log_file_position)
-                
-                new_content = f.read()
+            new_content = self._read_log_delta()
+            
+            if new_content is None or (not new_content and self._log_rotated()):
+                self._refresh_log_content()
+            elif new_content:
+                buffer = self.log_text_view.get_buffer()
+                end_iter = buffer.get_end_iter()
+                buffer.insert(end_iter, new_content)
                 
-                if new_content:
-                    self.log_file_position = f.tell()
-                    
-                    buffer = self.log_text_view.get_buffer()
-                    end_iter = buffer.get_end_iter()
-                    buffer.insert(end_iter, new_content)
-                    
-                    if self.auto_scroll_check.get_active():
-                        GLib.idle_add(self._scroll_log_to_end)
+                if self.auto_scroll_check.get_active():
+                    GLib.idle_add(self._scroll_log_to_end)
                         
         except Exception as e:
             logger.debug(f"Error tailing log file: {e}")
@@ -450,19 +545,16 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
     
     def _restart_daemon(self) -> None:
         """Restart the ODSC daemon."""
-        def restart_in_thread():
-            if not self._daemon.is_running():
-                GLib.idle_add(self._prompt_start_daemon_after_restart_check)
+        def on_status(is_running):
+            if not is_running:
+                self._prompt_start_daemon_after_restart_check()
                 return
+            self._daemon.restart_running_async(self._show_restart_daemon_result)
 
-            success, msg = self._daemon.restart()
-            GLib.idle_add(self._show_restart_daemon_result, success, msg)
-
-        thread = threading.Thread(target=restart_in_thread, daemon=True)
-        thread.start()
+        self._daemon.is_running_async(on_status)
 
     def _prompt_start_daemon_after_restart_check(self) -> bool:
-        """Prompt to start the daemon after an async restart status check."""
+        """Prompt to start the daemon after a restart found it not running."""
         if DialogHelper.show_confirm(
             self,
             "Daemon Not Running",
@@ -490,12 +582,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
 
     def _start_daemon(self) -> None:
         """Start the ODSC daemon."""
-        def start_in_thread():
-            success, msg = self._daemon.start()
-            GLib.idle_add(self._show_start_daemon_result, success, msg)
-
-        thread = threading.Thread(target=start_in_thread, daemon=True)
-        thread.start()
+        self._daemon.start_async(self._show_start_daemon_result)
 
     def _show_start_daemon_result(self, success: bool, msg: str) -> bool:
         """Show the result of an async daemon start."""
@@ -520,12 +607,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         Returns:
             False to cancel the GLib timer (one-shot check).
         """
-        def check_in_thread():
-            is_running = self._daemon.is_running()
-            GLib.idle_add(self._show_service_status_result, is_running)
-
-        thread = threading.Thread(target=check_in_thread, daemon=True)
-        thread.start()
+        self._daemon.is_running_async(self._show_service_status_result)
         return False
 
     def _show_service_status_result(self, is_running: bool) -> bool:
@@ -583,12 +665,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
     
     def _start_daemon_from_notification(self) -> None:
         """Start the daemon from the notification bar."""
-        def start_in_thread():
-            success, msg = self._daemon.start()
-            GLib.idle_add(self._show_notification_start_result, success, msg)
-
-        thread = threading.Thread(target=start_in_thread, daemon=True)
-        thread.start()
+        self._daemon.start_async(self._show_notification_start_result)
 
     def _show_notification_start_result(self, success: bool, msg: str) -> bool:
         """Show the result of starting the daemon from the notification bar."""
@@ -626,6 +703,12 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             self._show_error("Not authenticated. Please authenticate first.")
             return
         
+        if self._refresh_in_progress:
+            # Don't stack fetches or renders; reload once more after the
+            # current one so changes made since it started are still picked up
+            self._refresh_queued = True
+            return
+        
         self._update_status("Loading files from OneDrive...")
         
         def load_in_thread():
@@ -644,12 +727,17 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     
                     changes, new_delta_token = client.get_delta(delta_token)
                     
-                    # Use shared service to process delta changes
-                    file_cache = FileCacheService.process_delta_changes(changes, file_cache)
+                    # Use shared service to process delta changes; the freshly
+                    # loaded cache is ours, so it is updated in place
+                    updated, removed = FileCacheService.merge_delta_changes(changes, file_cache)
                     
-                    state['delta_token'] = new_delta_token
-                    state['file_cache'] = file_cache
-                    self._save_state_locked(state)
+                    # Write only the changed entries, not the whole state
+                    with self._state_lock:
+                        self.config.save_file_cache_changes(
+                            {path: file_cache[path] for path in updated},
+                            removed,
+                            new_delta_token,
+                        )
                     
                     # Convert cache to file list
                     files = FileCacheService.cache_to_file_list(file_cache)
@@ -658,7 +746,13 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     logger.info("Initial load: fetching all files")
                     GLib.idle_add(self._update_status, "Fetching all files (first time)...")
                     
-                    changes, new_delta_token = client.get_delta(None)
+                    # One status update per page of results
+                    changes, new_delta_token = client.get_delta(
+                        None,
+                        on_page=lambda count: GLib.idle_add(
+                            self._update_status, f"Fetching all files... {count} items so far"
+                        ),
+                    )
                     
                     # Use shared service to build initial cache
                     file_cache = FileCacheService.build_initial_cache(changes)
@@ -681,17 +775,32 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     user_friendly_error("load files from OneDrive", exc, item_type="file list"),
                 )
                 GLib.idle_add(self._update_status, "Failed to load files")
+                GLib.idle_add(self._refresh_finished)
         
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+        try:
+            self.executor.submit(load_in_thread)
+        except RuntimeError:
+            # Executor shut down by _on_destroy; the window is going away
+            logger.debug("Executor stopped; skipping file list load")
+            return
+        self._refresh_in_progress = True
+    
+    def _refresh_finished(self) -> bool:
+        """Mark the file list load done and run one queued while it was in flight."""
+        self._refresh_in_progress = False
+        if self._refresh_queued:
+            self._refresh_queued = False
+            self._load_remote_files()
+        return False
     
     def _update_file_list(self, files: List[Dict[str, Any]]) -> None:
         """Update file list view with folder hierarchy using chunked rendering.
         
         This method is intentionally long (260 lines) because it implements
         chunked rendering for performance with large file lists (10,000+ files).
-        The nested process_chunk() function maintains state across chunks using
-        closures, which is more efficient than class-level state management.
+        The nested process_chunk() idle callback maintains state across
+        main-loop iterations using closures, which is more efficient than
+        class-level state management.
         
         Refactoring this would require extracting ChunkedTreeRenderer class,
         but would add complexity without significant benefit since:
@@ -707,6 +816,9 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         expanded_paths = self._save_expanded_state()
         scroll_position = self._save_scroll_position()
         
+        # Rows are appended with the store detached from the view and
+        # unsorted; _finalize_file_list reattaches it and resorts once
+        self._suspend_tree_updates()
         self.file_store.clear()
         self._clear_tree_view_cache()
         
@@ -716,14 +828,12 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         
         logger.debug(f"Building file tree with {len(files)} items")
         
-        folder_iters = {}
-        remote_files_set = set()
-        
-        # Pre-compute sort keys for better performance
+        # Pre-compute sort keys for better performance, along with the
+        # per-item fields process_chunk needs so it never looks them up again
         items_with_keys = []
         for item in files:
             # Skip root folder artifact
-            name = item.get('name', '')
+            name = item.get('name', 'Unknown')
             if name.lower() == 'root':
                 parent_ref = item.get('parentReference', {})
                 parent_path = parent_ref.get('path', '') if parent_ref else ''
@@ -735,7 +845,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             is_folder = 'folder' in item or item.get('is_folder', False)
             if '_cache_path' in item:
                 cache_path = item['_cache_path']
-                parent = str(Path(cache_path).parent) if '/' in cache_path else ''
+                parent = split_parent(cache_path)[0]
                 sort_path = cache_path
             else:
                 parent_ref = item.get('parentReference', {})
@@ -744,61 +854,78 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             
             # Case-insensitive sort: folders first, then alphabetically by path
             sort_key = (not is_folder, parent.lower(), sort_path.lower())
-            items_with_keys.append((sort_key, item))
+            items_with_keys.append((sort_key, item, is_folder, name, item.get('id', '')))
         
-        # Sort once with pre-computed keys
-        items_with_keys.sort(key=lambda x: x[0])
-        sorted_items = [item for _, item in items_with_keys]
+        # Sort once with pre-computed keys, in place; rows are read straight
+        # from the sorted pairs rather than from another copied list
+        items_with_keys.sort(key=itemgetter(0))
         
-        # Use nonlocal variables accessible to nested function
-        self._folder_iters = {}
-        self._remote_files_set = set()
+        # Folder path -> TreeIter. The sort puts every folder ahead of every
+        # file, and a parent folder ahead of its subfolders, so a row's parent
+        # is already in this map by the time the row is inserted
+        folder_iters = self._folder_iters = {}
+        remote_files_set = self._remote_files_set = set()
         
         # Load state ONCE before processing (not per file!)
         state = self._load_state_locked()
         files_state = state.get('files', {})
         
-        # Process items in chunks for responsive UI
-        chunk_size = 50  # Process 50 items at a time for better responsiveness
-        total_items = len(sorted_items)
-        
-        def process_chunk(start_idx):
-            """Process a chunk of items and schedule next chunk."""
-            end_idx = min(start_idx + chunk_size, total_items)
+        # Sidecar per-folder file counts ([total, synced, remote_only]) built
+        # from the row data as it is appended, so folder status lookups never
+        # have to walk the TreeModel
+        folder_stats = {}
+        
+        # Siblings share a parent, so sanitize and validate each unique
+        # parent folder once: raw parentReference path -> sanitized path,
+        # and sanitized folder path -> validated absolute path
+        sanitized_parents = {}
+        validated_parents = {}
+        
+        # Process items from one idle source that inserts rows for up to
+        # _ROW_BATCH_BUDGET_US per main-loop iteration, keeping the UI responsive
+        total_items = len(items_with_keys)
+        next_idx = 0
+        
+        def process_chunk():
+            """Process items until the time budget is spent; repeat until done."""
+            nonlocal next_idx
+            deadline = GLib.get_monotonic_time() + _ROW_BATCH_BUDGET_US
             
-            for i in range(start_idx, end_idx):
-                item = sorted_items[i]
-                name = item.get('name', 'Unknown')
-                is_folder = 'folder' in item or item.get('is_folder', False)
-                item_id = item.get('id', '')
+            while next_idx < total_items and GLib.get_monotonic_time() < deadline:
+                _, item, is_folder, name, item_id = items_with_keys[next_idx]
+                next_idx += 1
                 
                 try:
                     parent_ref = item.get('parentReference', {})
-                    parent_path = parent_ref.get('path', '')
-                    if parent_path:
-                        parent_path = sanitize_onedrive_path(parent_path)
+                    raw_parent = parent_ref.get('path', '')
+                    parent_path = sanitized_parents.get(raw_parent)
+                    if parent_path is None:
+                        parent_path = sanitize_onedrive_path(raw_parent) if raw_parent else ''
+                        sanitized_parents[raw_parent] = parent_path
                     
                     if not parent_path and '_cache_path' in item:
                         cache_path = item['_cache_path']
-                        if '/' in cache_path:
-                            parent_path = str(Path(cache_path).parent)
-                            if parent_path == '.':
-                                parent_path = ''
+                        parent_path = split_parent(cache_path)[0]
                         full_path = cache_path
+                    elif parent_path:
+                        full_path = f"{parent_path}/{name}"
                     else:
-                        if parent_path:
-                            full_path = str(Path(parent_path) / name)
-                        else:
-                            full_path = name
+                        full_path = name
                     
                     # Skip root folder artifact
                     if full_path.lower() in ('root', 'root/', '/root') or name.lower() == 'root':
                         logger.debug(f"Skipping 'root' folder artifact: {name}")
                         continue
                     
-                    validated_path = validate_sync_path(full_path, sync_dir)
+                    # Full validation once per folder, then a cheap check per entry
+                    folder_path, leaf_name = split_parent(full_path)
+                    validated_parent = validated_parents.get(folder_path)
+                    if validated_parent is None:
+                        validated_parent = validate_sync_path(folder_path, sync_dir)
+                        validated_parents[folder_path] = validated_parent
+                    validate_sync_child(validated_parent, leaf_name)
                     
-                    self._remote_files_set.add(full_path)
+                    remote_files_set.add(full_path)
                 
                 except SecurityError as e:
                     logger.warning(f"Skipping unsafe path for {name}: {e}")
@@ -808,16 +935,16 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     continue
                 
                 parent_iter = None
-                if parent_path and parent_path != '/':
-                    parent_iter = self._folder_iters.get(parent_path.lstrip('/'))
+                if parent_path:
+                    parent_iter = folder_iters.get(parent_path)
                     
-                    # If parent folder doesn't exist yet, create it (and ancestors)
-                    if parent_iter is None and parent_path:
+                    # Parent missing from the listing itself: synthesize it (and ancestors)
+                    if parent_iter is None:
                         parent_iter = self._ensure_parent_folders(parent_path, sync_dir)
                 
                 if is_folder:
                     # Skip if this folder was already added (deduplication)
-                    if full_path in self._folder_iters:
+                    if full_path in folder_iters:
                         logger.debug(f"Skipping duplicate folder: {full_path}")
                         continue
                     
@@ -826,10 +953,10 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     modified = ""
                     is_local = (sync_dir / full_path).exists()
                     
-                    iter = self.file_store.append(parent_iter, [
+                    iter = self._insert_row(parent_iter, [
                         icon, name, size_str, modified, is_local, item_id, True, full_path, ""
                     ])
-                    self._folder_iters[full_path] = iter
+                    folder_iters[full_path] = iter
                     
                 else:
                     icon = self._get_file_icon(name)
@@ -843,27 +970,34 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
                     file_state = files_state.get(full_path, {})
                     error_msg = file_state.get('upload_error', '')
                     
-                    self.file_store.append(parent_iter, [
+                    self._insert_row(parent_iter, [
                         icon, name, size, modified, is_local, item_id, False, full_path, error_msg
                     ])
+                    
+                    remote_only = not is_local and bool(item_id)
+                    folder = full_path
+                    while '/' in folder:
+                        folder = folder.rsplit('/', 1)[0]
+                        counts = folder_stats.setdefault(folder, [0, 0, 0])
+                        counts[0] += 1
+                        counts[1] += is_local
+                        counts[2] += remote_only
             
             # Update progress
             if total_items > 0:
-                progress = int((end_idx / total_items) * 100)
+                progress = int((next_idx / total_items) * 100)
                 self._update_status(f"Loading files... {progress}%")
             
-            # Schedule next chunk or finalize
-            if end_idx < total_items:
-                # Use timeout instead of idle_add for better UI responsiveness
-                GLib.timeout_add(10, process_chunk, end_idx)
-            else:
-                # All items processed
-                GLib.idle_add(self._finalize_file_list, expanded_paths, scroll_position)
+            if next_idx < total_items:
+                return True  # Keep the idle source for the remaining items
             
-            return False  # Don't repeat this idle callback
+            # All items processed
+            GLib.idle_add(self._finalize_file_list, expanded_paths, scroll_position,
+                          folder_stats)
+            return False
         
         # Start processing chunks
-        GLib.idle_add(process_chunk, 0)
+        GLib.idle_add(process_chunk)
     
     def _ensure_parent_folders(self, parent_path: str, sync_dir: Path):
         """Ensure all parent folders exist in tree, creating them if needed.
@@ -882,13 +1016,12 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             return self._folder_iters[parent_path]
         
         # Split path into parts and ensure each level exists
-        parts = Path(parent_path).parts
         current_path = ""
         parent_iter = None
         
-        for part in parts:
+        for part in parent_path.split('/'):
             if current_path:
-                current_path = str(Path(current_path) / part)
+                current_path = f"{current_path}/{part}"
             else:
                 current_path = part
             
@@ -896,7 +1029,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             if current_path not in self._folder_iters:
                 # Create this folder level
                 is_local = (sync_dir / current_path).exists()
-                iter = self.file_store.append(parent_iter, [
+                iter = self._insert_row(parent_iter, [
                     "folder", part, "", "", is_local, "", True, current_path, ""
                 ])
                 self._folder_iters[current_path] = iter
@@ -906,13 +1039,23 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         
         return parent_iter
     
-    def _finalize_file_list(self, expanded_paths, scroll_position):
+    def _finalize_file_list(self, expanded_paths, scroll_position, folder_stats=None):
         """Finalize file list after chunked rendering.
         
         Args:
             expanded_paths: Previously expanded paths to restore
             scroll_position: Previous scroll position to restore
+            folder_stats: Per-folder [total, synced, remote_only] file counts
+                collected while the rows were appended
         """
+        self._resume_tree_updates()
+        
+        # Folder counts cached while rows were still arriving are partial
+        self._clear_tree_view_cache()
+        if folder_stats:
+            self._folder_stats_cache = {
+                path: tuple(counts) for path, counts in folder_stats.items()
+            }
         self._restore_expanded_state(expanded_paths)
         self._restore_scroll_position(scroll_position)
         
@@ -920,6 +1063,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
         self._update_status(f"Loaded {total_items} items")
         logger.info(f"File tree loaded with {total_items} items")
         
+        self._refresh_finished()
         return False  # Don't repeat this idle callback
     
     def _format_size(self, size: int) -> str:
@@ -944,7 +1088,7 @@ class OneDriveGUI(MenuBarMixin, FileTreeViewMixin, FileOperationsMixin, Gtk.Appl
             message: Status message (will be escaped to prevent markup injection)
         """
         # Escape user-controlled data to prevent Pango markup injection
-        self.status_label.set_markup(f"<i>Status: {html.escape(message)}</i>")
+        self.status_label.set_markup(f"<i>Status: {_escape_markup(message)}</i>")
     
     def _show_error(self, title: str, message: str = None) -> None:
         """Show error dialog.
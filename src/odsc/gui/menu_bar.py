@@ -3,6 +3,7 @@
 import logging
 import secrets
 import threading
+import time
 import webbrowser
 import socketserver
 
@@ -109,10 +110,18 @@ class MenuBarMixin:
         self._logout()
     
     def _on_auth_info_clicked(self, widget) -> None:
-        """Handle Authentication Info menu item click."""
-        dialog = AuthInfoDialog(self, self.config, self._get_client())
-        dialog.run()
-        dialog.destroy()
+        """Handle Authentication Info menu item click.
+        
+        The dialog is created once and hidden after use; every click
+        refreshes its contents (building them on first use) before
+        presenting it.
+        """
+        if self._auth_dialog is None:
+            self._auth_dialog = AuthInfoDialog(self, self.config, None)
+        self._auth_dialog.refresh(self._get_client())
+        self._auth_dialog.present()
+        self._auth_dialog.run()
+        self._auth_dialog.hide()
     
     def _authenticate(self) -> None:
         """Perform OneDrive authentication."""
@@ -132,7 +141,6 @@ class MenuBarMixin:
         
         def wait_for_callback():
             try:
-                import time
                 logger.info("Starting local callback server on localhost:8080")
                 AuthCallbackHandler.reset()
 
@@ -208,6 +216,7 @@ class MenuBarMixin:
         """Handle successful authentication."""
         self._update_status("Authentication successful!")
         self._update_auth_menu_state()
+        self._prefetch_user_info()
         self._load_remote_files()
     
     def _logout(self) -> None:
@@ -266,7 +275,6 @@ class MenuBarMixin:
         """Handle About menu item click."""
         try:
             from .. import __version__
-            from ..command_socket import send_command
             from .splash import SplashScreen
 
             gui_version = __version__
@@ -2,6 +2,7 @@
 """Logging configuration for ODSC."""
 
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -18,7 +19,6 @@ def setup_logging(level: Optional[str] = None, log_file: Optional[Path] = None)
     """
     # Determine log level
     if level is None:
-        import os
         level = os.environ.get('ODSC_LOG_LEVEL', 'INFO').upper()
     
     numeric_level = getattr(logging, level, logging.INFO)
@@ -89,3 +89,19 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
+
+
+def set_log_level(level: str) -> None:
+    """Change the level of the root logger and its handlers in place.
+    
+    Unlike :func:`setup_logging` this leaves the handlers (and the log file)
+    untouched, so it is cheap and safe to call while other threads log.
+    
+    Args:
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    numeric_level = getattr(logging, level, logging.INFO)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(numeric_level)
+    for handler in root_logger.handlers:
+        handler.setLevel(numeric_level)
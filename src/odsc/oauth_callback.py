@@ -6,6 +6,20 @@ from urllib.parse import urlparse, parse_qs
 
 logger = logging.getLogger(__name__)
 
+_SUCCESS_HTML = (
+    b"<html><body><h1>Authentication successful!</h1>"
+    b"<p>You can close this window now.</p></body></html>"
+)
+
+# Full success response (status line, headers and body) written in one call
+_SUCCESS_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/html\r\n"
+    b"Content-Length: " + str(len(_SUCCESS_HTML)).encode() + b"\r\n"
+    b"Connection: close\r\n"
+    b"\r\n" + _SUCCESS_HTML
+)
+
 
 class AuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """HTTP handler for the local OAuth redirect URI.
@@ -31,41 +45,41 @@ class AuthCallbackHandler(http.server.BaseHTTPRequestHandler):
         """Handle the GET request that OneDrive redirects to after auth."""
         logger.info(f"OAuth callback received request: {self.path}")
         parsed = urlparse(self.path)
-        if parsed.path == '/':
-            params = parse_qs(parsed.query)
-            if 'code' in params:
-                AuthCallbackHandler.auth_code = params['code'][0]
-                AuthCallbackHandler.state = params.get('state', [None])[0]
-                logger.info("OAuth callback: authorization code received")
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(
-                    b"<html><body><h1>Authentication successful!</h1>"
-                    b"<p>You can close this window now.</p></body></html>"
-                )
-            elif 'error' in params:
-                error = params['error'][0]
-                desc = params.get('error_description', [''])[0]
-                logger.error(f"OAuth callback error: {error} - {desc}")
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(
-                    f"<html><body><h1>Authentication failed</h1><p>{error}: {desc}</p></body></html>".encode()
-                )
-            else:
-                logger.warning(f"OAuth callback: no code or error in params: {params}")
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(
-                    b"<html><body><h1>Authentication failed!</h1></body></html>"
-                )
-        else:
+        if parsed.path != '/':
             logger.debug(f"OAuth callback: ignoring request to {parsed.path}")
             self.send_response(404)
             self.end_headers()
+            return
+
+        params = parse_qs(parsed.query)
+        code = params.get('code', (None,))[0]
+        if code:
+            AuthCallbackHandler.auth_code = code
+            AuthCallbackHandler.state = params.get('state', (None,))[0]
+            logger.info("OAuth callback: authorization code received")
+            self.close_connection = True
+            self.wfile.write(_SUCCESS_RESPONSE)
+            self.wfile.flush()
+            return
+
+        if 'error' in params:
+            error = params['error'][0]
+            desc = params.get('error_description', ('',))[0]
+            logger.error(f"OAuth callback error: {error} - {desc}")
+            self.send_response(400)
+            self.send_header('Content-type', 'text/html')
+            self.end_headers()
+            self.wfile.write(
+                f"<html><body><h1>Authentication failed</h1><p>{error}: {desc}</p></body></html>".encode()
+            )
+        else:
+            logger.warning(f"OAuth callback: no code or error in params: {params}")
+            self.send_response(400)
+            self.send_header('Content-type', 'text/html')
+            self.end_headers()
+            self.wfile.write(
+                b"<html><body><h1>Authentication failed!</h1></body></html>"
+            )
 
     def log_message(self, format: str, *args) -> None:  # noqa: A002
         """Route access logs through the application logger."""
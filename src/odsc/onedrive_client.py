@@ -129,6 +129,12 @@ class OneDriveClient:
     # Upload-session fragment size. Graph requires a multiple of 320 KiB
     # (327680 bytes) for every fragment except the final one.
     UPLOAD_FRAGMENT_SIZE = 10 * 327680  # ~3.1 MiB
+    # Stop serving a cached /me profile this many seconds before the access
+    # token it was fetched with expires.
+    USER_INFO_CACHE_MARGIN = 60
+    # Items requested per delta page. Graph's default page is far smaller,
+    # and every page is a full HTTPS round trip.
+    DELTA_PAGE_SIZE = 999
 
     def __init__(self, client_id: Optional[str] = None, token_data: Optional[Dict[str, Any]] = None):
         """Initialize OneDrive client.
@@ -145,6 +151,9 @@ class OneDriveClient:
         self._token_lock = threading.RLock()
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0.0
+        # (access_token, valid_until, profile) for /me; dropped whenever the
+        # token changes
+        self._user_info_cache: Optional[Tuple[Optional[str], float, Dict[str, Any]]] = None
         with self._token_lock:
             self._set_token_data_locked(token_data or {})
 
@@ -153,6 +162,7 @@ class OneDriveClient:
         self.token_data = dict(token_data)
         self._access_token = self.token_data.get('access_token')
         self._token_expires_at = float(self.token_data.get('expires_at', 0) or 0)
+        self._user_info_cache = None
     
     def _sanitize_for_log(self, text: str) -> str:
         """Remove sensitive data from log output.
@@ -422,14 +432,49 @@ class OneDriveClient:
             self._log_request_exception(f"Request failed for {method} {endpoint}", exc)
             raise
     
-    def get_user_info(self) -> Dict[str, Any]:
+    def get_user_info(self, use_cache: bool = True) -> Dict[str, Any]:
         """Get user profile information.
         
+        The profile is cached per access token until shortly before that
+        token expires, and is invalidated whenever the token is exchanged or
+        refreshed.
+        
+        Args:
+            use_cache: Return the cached profile when one is still valid
+        
         Returns:
             User profile data including displayName, mail, userPrincipalName, etc.
         """
+        if use_cache:
+            cached = self.get_cached_user_info()
+            if cached is not None:
+                return cached
+        
         response = self._api_request('GET', '/me')
-        return response.json()
+        user_info = response.json()
+        with self._token_lock:
+            self._user_info_cache = (
+                self._access_token,
+                self._token_expires_at - self.USER_INFO_CACHE_MARGIN,
+                user_info,
+            )
+        return dict(user_info)
+    
+    def get_cached_user_info(self) -> Optional[Dict[str, Any]]:
+        """Return the cached user profile without a network call.
+        
+        Returns:
+            Copy of the cached profile, or None if nothing valid is cached
+        """
+        with self._token_lock:
+            cached = self._user_info_cache
+            access_token = self._access_token
+        if cached is None:
+            return None
+        cached_token, valid_until, user_info = cached
+        if cached_token != access_token or valid_until <= time.time():
+            return None
+        return dict(user_info)
     
     def list_files(self, path: str = "/", paginate: bool = True) -> List[Dict[str, Any]]:
         """List files in OneDrive directory with pagination support.
@@ -516,7 +561,12 @@ class OneDriveClient:
             self._log_request_exception(f"Request failed for GET {parsed.path}", exc)
             raise
     
-    def get_delta(self, delta_token: Optional[str] = None) -> Tuple[List[Dict[str, Any]], str]:
+    def get_delta(
+        self,
+        delta_token: Optional[str] = None,
+        page_size: Optional[int] = DELTA_PAGE_SIZE,
+        on_page: Optional[Callable[[int], None]] = None,
+    ) -> Tuple[List[Dict[str, Any]], str]:
         """Get changes since last sync using delta query.
         
         This is much more efficient than list_all_files() for incremental syncs.
@@ -524,6 +574,11 @@ class OneDriveClient:
         
         Args:
             delta_token: Token from previous delta query (None for initial sync)
+            page_size: Items to request per page on an initial query (sent as
+                ``$top`` and carried through the nextLinks), or None for the
+                server default. Resumed queries reuse the deltaLink as is.
+            on_page: Optional callback given the running item count after
+                each page, for progress reporting
             
         Returns:
             Tuple of (list of changed items, new delta token)
@@ -540,6 +595,8 @@ class OneDriveClient:
         else:
             # Start new delta query from root
             url = f"{self.API_BASE}/me/drive/root/delta"
+            if page_size:
+                url += f"?$top={page_size}"
             logger.info("Starting initial delta query (will fetch all items)")
         
         all_changes = []
@@ -555,6 +612,8 @@ class OneDriveClient:
             data = response.json()
             items = data.get('value', [])
             all_changes.extend(items)
+            if on_page is not None:
+                on_page(len(all_changes))
             
             # Check for next page
             next_link = data.get('@odata.nextLink')
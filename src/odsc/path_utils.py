@@ -3,7 +3,7 @@
 
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,23 @@ class SecurityError(Exception):
     pass
 
 
+def split_parent(rel_path: str) -> Tuple[str, str]:
+    """Split a '/'-separated relative path into (parent, name).
+    
+    String-only equivalent of ``Path(rel_path).parent`` / ``.name`` for the
+    already-sanitized relative paths used in state and the file cache, cheap
+    enough for per-item loops. The parent is '' for top-level entries.
+    
+    Args:
+        rel_path: Relative path (e.g., "Documents/file.txt")
+        
+    Returns:
+        Tuple of (parent_path, name)
+    """
+    parent, _, name = rel_path.rpartition('/')
+    return parent, name
+
+
 def extract_item_path(item: Dict[str, Any]) -> str:
     """Extract and sanitize full path from OneDrive item.
     
@@ -115,6 +132,33 @@ def validate_sync_path(rel_path: str, sync_dir: Path) -> Path:
     return resolved_path
 
 
+def validate_sync_child(validated_parent: Path, name: str) -> Path:
+    """Validate a single entry directly inside an already-validated folder.
+    
+    Gives the same result as :func:`validate_sync_path` for the child of a
+    folder that has passed it, but costs one ``lstat`` instead of a walk
+    over every ancestor plus a ``resolve()``. Intended for loops over many
+    siblings that share a parent.
+    
+    Args:
+        validated_parent: Path returned by validate_sync_path for the parent
+        name: Single path component of the child
+        
+    Returns:
+        Validated absolute path
+        
+    Raises:
+        SecurityError: If name is not a single plain component or is a symlink
+    """
+    if name in ('', '.', '..') or '/' in name:
+        raise SecurityError(f"Invalid path component for sync operations: {name!r}")
+    
+    child = validated_parent / name
+    if child.is_symlink():
+        raise SecurityError(f"Symlink detected in sync path before resolution: {name}")
+    return child
+
+
 def cleanup_empty_parent_dirs(file_path: Path, sync_dir: Path) -> None:
     """Remove empty parent directories up to sync_dir.
     
@@ -5,10 +5,9 @@ the GUI and sync daemon to eliminate code duplication.
 """
 
 import logging
-from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Set, Tuple
 
-from ..path_utils import sanitize_onedrive_path, SecurityError
+from ..path_utils import sanitize_onedrive_path, split_parent, SecurityError
 
 logger = logging.getLogger(__name__)
 
@@ -31,28 +30,65 @@ class FileCacheService:
             Updated file cache dictionary
         """
         file_cache = dict(existing_cache)  # Make a copy
+        FileCacheService.merge_delta_changes(changes, file_cache)
+        return file_cache
+    
+    @staticmethod
+    def merge_delta_changes(
+        changes: List[Dict[str, Any]],
+        file_cache: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Set[str], Set[str]]:
+        """Apply delta changes to a file cache in place.
+        
+        Args:
+            changes: List of change items from OneDrive delta query
+            file_cache: File cache dictionary to update
+            
+        Returns:
+            Tuple of (updated_paths, removed_paths) describing the net
+            change, so callers can persist just those entries
+        """
+        updated_paths: Set[str] = set()
+        removed_paths: Set[str] = set()
+        build_item_path = FileCacheService._item_path_builder()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # item id -> cache path, built on the first deletion so each
+        # deletion is a lookup instead of a scan of the whole cache
+        id_to_path = None
         
         for item in changes:
             if 'deleted' in item:
                 # Handle deleted items
                 item_id = item['id']
-                for path in list(file_cache.keys()):
-                    if file_cache[path].get('id') == item_id:
-                        del file_cache[path]
+                if id_to_path is None:
+                    id_to_path = {
+                        entry.get('id'): path for path, entry in file_cache.items()
+                    }
+                path = id_to_path.pop(item_id, None)
+                # The path may since have been reused by a different item
+                if path is not None and file_cache.get(path, {}).get('id') == item_id:
+                    del file_cache[path]
+                    updated_paths.discard(path)
+                    removed_paths.add(path)
+                    if debug:
                         logger.debug(f"Removed deleted item from cache: {path}")
-                        break
             else:
                 # Handle added/modified items
                 try:
-                    full_path = FileCacheService._build_item_path(item)
+                    full_path = build_item_path(item)
                     file_cache[full_path] = item
-                    logger.debug(f"Updated cache for: {full_path}")
+                    removed_paths.discard(full_path)
+                    updated_paths.add(full_path)
+                    if id_to_path is not None:
+                        id_to_path[item.get('id')] = full_path
+                    if debug:
+                        logger.debug(f"Updated cache for: {full_path}")
                 except (SecurityError, KeyError, TypeError, ValueError) as e:
                     # Skip known-malformed/unsafe items but let unexpected
                     # errors propagate so real failures are not hidden.
                     logger.warning(f"Skipping malformed delta item: {e}")
         
-        return file_cache
+        return updated_paths, removed_paths
     
     @staticmethod
     def build_initial_cache(
@@ -67,11 +103,12 @@ class FileCacheService:
             File cache dictionary
         """
         file_cache = {}
+        build_item_path = FileCacheService._item_path_builder()
         
         for item in changes:
             if 'deleted' not in item:
                 try:
-                    full_path = FileCacheService._build_item_path(item)
+                    full_path = build_item_path(item)
                     file_cache[full_path] = item
                 except (SecurityError, KeyError, TypeError, ValueError) as e:
                     logger.warning(f"Skipping malformed delta item: {e}")
@@ -95,29 +132,35 @@ class FileCacheService:
             # Ensure name field exists
             if 'name' not in item and path:
                 item = dict(item)
-                item['name'] = Path(path).name
+                item['name'] = split_parent(path)[1]
                 item['_cache_path'] = path
             files.append(item)
         return files
     
     @staticmethod
-    def _build_item_path(item: Dict[str, Any]) -> str:
-        """Build full path for an item from its metadata.
+    def _item_path_builder() -> Callable[[Dict[str, Any]], str]:
+        """Return a function that builds an item's full path from its metadata.
+        
+        Siblings share a parentReference path, so the returned function
+        sanitizes each distinct parent once and reuses the result for the
+        rest of the batch. Make one per batch of changes.
         
-        Args:
-            item: OneDrive item metadata
-            
         Returns:
-            Full path string
+            Function mapping OneDrive item metadata to its full path string
         """
-        parent_ref = item.get('parentReference', {})
-        parent_path = parent_ref.get('path', '')
-        name = item.get('name', '')
+        sanitized_parents: Dict[str, str] = {}
         
-        if parent_path:
-            safe_parent = sanitize_onedrive_path(parent_path)
-            full_path = str(Path(safe_parent) / name) if safe_parent else name
-        else:
-            full_path = name
+        def build_item_path(item: Dict[str, Any]) -> str:
+            parent_path = item.get('parentReference', {}).get('path', '')
+            name = item.get('name', '')
+            
+            if not parent_path:
+                return name
+            
+            safe_parent = sanitized_parents.get(parent_path)
+            if safe_parent is None:
+                safe_parent = sanitize_onedrive_path(parent_path)
+                sanitized_parents[parent_path] = safe_parent
+            return f"{safe_parent}/{name}" if safe_parent else name
         
-        return full_path
+        return build_item_path
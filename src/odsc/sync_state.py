@@ -262,13 +262,18 @@ class SyncStateManager:
                     count += 1
         return count
 
-    def mark_file_not_downloaded(self, rel_path: str) -> None:
-        """Set ``downloaded=False`` for *rel_path* (used by GUI on remove)."""
+    def mark_file_not_downloaded(self, rel_path: str) -> bool:
+        """Set ``downloaded=False`` for *rel_path* (used by GUI on remove).
+
+        Returns True if *rel_path* was tracked, i.e. there is a change to persist.
+        """
         with self._lock:
             self._ensure_initialized()
             entry = self._state["files"].get(rel_path)
-            if entry is not None:
-                entry["downloaded"] = False
+            if entry is None:
+                return False
+            entry["downloaded"] = False
+            return True
 
     # ------------------------------------------------------------------ #
     # File cache (OneDrive metadata snapshot)                              #
@@ -9,7 +9,7 @@ import base64
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from cryptography.fernet import Fernet, InvalidToken
 import keyring
@@ -35,6 +35,9 @@ class TokenStore:
 
     def __init__(self, token_path: Path) -> None:
         self.token_path = token_path
+        # Last decrypted token keyed by the file's (mtime_ns, size, inode)
+        self._cached_key: Optional[Tuple[int, int, int]] = None
+        self._cached_token: Optional[Dict[str, Any]] = None
 
     # ------------------------------------------------------------------ #
     # Public API                                                           #
@@ -47,19 +50,34 @@ class TokenStore:
             token_data: Raw token dict (access_token, refresh_token, …).
         """
         encrypted = self._encrypt(token_data)
+        self._invalidate_cache()
         atomic_write(self.token_path, encrypted, mode=0o600)
         logger.info("Token saved with encryption")
 
     def load(self) -> Optional[Dict[str, Any]]:
         """Read and decrypt the stored token.
 
+        The decrypted token is cached and reused for as long as the token
+        file's modification time, size and inode are unchanged, so repeated
+        loads skip the keyring lookup and decryption.
+
         Returns:
             Token dict, or ``None`` if no token file exists or decryption
             fails.
         """
-        if not self.token_path.exists():
+        try:
+            st = self.token_path.stat()
+        except FileNotFoundError:
+            self._invalidate_cache()
+            return None
+        except OSError as exc:
+            logger.error(f"Could not stat token file: {exc}")
             return None
 
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if key == self._cached_key and self._cached_token is not None:
+            return dict(self._cached_token)
+
         try:
             encrypted_data = self.token_path.read_bytes()
         except OSError as exc:
@@ -69,6 +87,8 @@ class TokenStore:
         try:
             token_data = self._decrypt(encrypted_data)
             logger.info("Token loaded and decrypted successfully")
+            self._cached_key = key
+            self._cached_token = dict(token_data)
             return token_data
 
         except ValueError as exc:
@@ -81,12 +101,17 @@ class TokenStore:
 
     def delete(self) -> None:
         """Delete the token file (e.g. on logout)."""
+        self._invalidate_cache()
         self.token_path.unlink(missing_ok=True)
 
     # ------------------------------------------------------------------ #
     # Internal                                                             #
     # ------------------------------------------------------------------ #
 
+    def _invalidate_cache(self) -> None:
+        self._cached_key = None
+        self._cached_token = None
+
     def _get_key(self) -> bytes:
         """Return the Fernet encryption key, creating it if necessary."""
         key_str = keyring.get_password(_KEYRING_SERVICE, _KEYRING_KEY_NAME)
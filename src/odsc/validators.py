@@ -1,12 +1,16 @@
 """Configuration validators for ODSC."""
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Supported log levels, in increasing severity
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
 
 class ValidationError(Exception):
     """Raised when configuration validation fails."""
@@ -112,7 +116,6 @@ class SyncDirectoryValidator(ConfigValidator):
             )
         
         # Check write permissions
-        import os
         if not os.access(path, os.W_OK):
             raise ValidationError(
                 f"Sync directory is not writable: {path}"
@@ -124,7 +127,7 @@ class SyncDirectoryValidator(ConfigValidator):
 class LogLevelValidator(ConfigValidator):
     """Validates log level."""
     
-    VALID_LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+    VALID_LEVELS = frozenset(LOG_LEVELS)
     
     def validate(self, value: Any) -> str:
         if not isinstance(value, str):
@@ -134,7 +137,7 @@ class LogLevelValidator(ConfigValidator):
         
         if level not in self.VALID_LEVELS:
             raise ValidationError(
-                f"Invalid log level: {value}. Must be one of: {', '.join(sorted(self.VALID_LEVELS))}"
+                f"Invalid log level: {value}. Must be one of: {', '.join(LOG_LEVELS)}"
             )
         
         return level
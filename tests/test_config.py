@@ -3,8 +3,10 @@
 
 import tempfile
 import json
+import types
 from pathlib import Path
 
+from odsc import cli
 from odsc.config import Config
 from odsc.token_store import TokenStore
 
@@ -40,6 +42,49 @@ def test_config_save_load():
         assert config2.sync_interval == 600
 
 
+def test_config_batch_saves_once(monkeypatch):
+    """Values set inside batch() are written with a single save on exit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir))
+        saves = []
+        original_save = config.save
+        monkeypatch.setattr(config, 'save', lambda: (saves.append(1), original_save()))
+
+        with config.batch():
+            config.set('sync_interval', 600)
+            with config.batch():
+                config.set('max_sync_workers', 8)
+            assert saves == []
+
+        assert saves == [1]
+        on_disk = json.loads(config.config_path.read_text())
+        assert on_disk['sync_interval'] == 600
+        assert on_disk['max_sync_workers'] == 8
+
+        config.set('sync_interval', 900, save=False)
+        assert saves == [1]
+        assert config.sync_interval == 900
+
+
+def test_cmd_config_set_reports_save_failure(monkeypatch, capsys):
+    """A failed batch save is reported and no value is claimed as set."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir))
+
+        def failing_save():
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config, 'save', failing_save)
+        monkeypatch.setattr(cli, 'Config', lambda: config)
+
+        rc = cli.cmd_config(types.SimpleNamespace(list=False, set=['sync_interval=600']))
+
+        out = capsys.readouterr().out
+        assert rc == 1
+        assert "disk full" in out
+        assert "✓" not in out
+
+
 def test_token_save_load():
     """Test token save and load."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -74,6 +119,33 @@ def test_token_load_value_error_preserves_token_file(monkeypatch):
         assert token_path.read_bytes() == b"encrypted-token"
 
 
+def test_token_load_reuses_decrypted_token_until_file_changes(monkeypatch):
+    """Unchanged token files are decrypted once; a rewrite is picked up."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = TokenStore(Path(tmpdir) / ".onedrive_token")
+        store.save({'access_token': 'first'})
+
+        decrypts = []
+        real_decrypt = store._decrypt
+
+        def counting_decrypt(data):
+            decrypts.append(data)
+            return real_decrypt(data)
+
+        monkeypatch.setattr(store, "_decrypt", counting_decrypt)
+
+        assert store.load() == {'access_token': 'first'}
+        assert store.load() == {'access_token': 'first'}
+        assert len(decrypts) == 1
+
+        store.save({'access_token': 'second'})
+        assert store.load() == {'access_token': 'second'}
+        assert len(decrypts) == 2
+
+        store.token_path.unlink()
+        assert store.load() is None
+
+
 def test_config_save_uses_atomic_temp_file_cleanup():
     """Config saves should replace the file without leaving temp files behind."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -40,6 +40,49 @@ def test_process_delta_changes_updates_and_removes_entries():
     assert updated["Docs/keep.txt"]["id"] == "keep"
 
 
+def test_process_delta_changes_tracks_items_added_in_the_same_delta():
+    """Deletions should find items added earlier in the same delta, but not reused paths."""
+    updated = FileCacheService.process_delta_changes(
+        [
+            {"id": "1", "deleted": {"state": "deleted"}},
+            {"id": "2", "name": "new.txt", "parentReference": {"path": "/drive/root:/Docs"}},
+            {"id": "3", "name": "old.txt", "parentReference": {"path": "/drive/root:/Docs"}},
+            {"id": "2", "deleted": {"state": "deleted"}},
+            {"id": "1", "deleted": {"state": "deleted"}},
+        ],
+        {
+            "Docs/old.txt": {"id": "1", "name": "old.txt"},
+            "Docs/keep.txt": {"id": "keep", "name": "keep.txt"},
+        },
+    )
+
+    assert "Docs/new.txt" not in updated
+    assert updated["Docs/old.txt"]["id"] == "3"
+    assert updated["Docs/keep.txt"]["id"] == "keep"
+
+
+def test_merge_delta_changes_reports_net_updates_and_removals():
+    """In-place merging should report only the net changed and removed paths."""
+    cache = {
+        "Docs/old.txt": {"id": "1", "name": "old.txt"},
+        "Docs/keep.txt": {"id": "keep", "name": "keep.txt"},
+    }
+
+    updated, removed = FileCacheService.merge_delta_changes(
+        [
+            {"id": "1", "deleted": {"state": "deleted"}},
+            {"id": "2", "name": "new.txt", "parentReference": {"path": "/drive/root:/Docs"}},
+            {"id": "3", "name": "gone.txt", "parentReference": {"path": "/drive/root:/Docs"}},
+            {"id": "3", "deleted": {"state": "deleted"}},
+        ],
+        cache,
+    )
+
+    assert updated == {"Docs/new.txt"}
+    assert removed == {"Docs/old.txt", "Docs/gone.txt"}
+    assert set(cache) == {"Docs/keep.txt", "Docs/new.txt"}
+
+
 def test_process_delta_changes_ignores_invalid_items(caplog):
     """Malformed OneDrive paths should be skipped instead of breaking the update."""
     existing = {"safe.txt": {"id": "safe"}}
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for OAuth callback state handling."""
 
+import io
 from types import SimpleNamespace
 
 from odsc import cli
@@ -19,6 +20,26 @@ def test_auth_callback_handler_reset_clears_stale_values():
     assert AuthCallbackHandler.state is None
 
 
+def test_auth_callback_handler_writes_success_response_in_one_block():
+    """A successful callback captures code/state and writes a complete response."""
+    handler = AuthCallbackHandler.__new__(AuthCallbackHandler)
+    handler.path = "/?code=abc&state=xyz"
+    handler.wfile = io.BytesIO()
+
+    try:
+        handler.do_GET()
+
+        assert AuthCallbackHandler.auth_code == "abc"
+        assert AuthCallbackHandler.state == "xyz"
+        response = handler.wfile.getvalue()
+        headers, body = response.split(b"\r\n\r\n", 1)
+        assert headers.startswith(b"HTTP/1.1 200 OK")
+        assert f"Content-Length: {len(body)}".encode() in headers
+        assert b"Authentication successful!" in body
+    finally:
+        AuthCallbackHandler.reset()
+
+
 def test_get_auth_url_uses_provided_state():
     """Explicit auth state should be preserved for callback validation."""
     client = OneDriveClient()
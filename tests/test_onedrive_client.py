@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for OneDrive client download behavior."""
 
+import time
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
 
@@ -242,6 +243,60 @@ def test_api_request_uses_cached_access_token(monkeypatch):
     assert captured["authorization"] == "Bearer token"
 
 
+def test_get_user_info_is_cached_until_token_changes(monkeypatch):
+    """Repeated profile lookups reuse the cached /me response per token."""
+    client = OneDriveClient(token_data={"access_token": "token", "expires_at": 10**12})
+    calls = []
+
+    def fake_api_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        return FakeJsonResponse({"displayName": f"User {len(calls)}"})
+
+    monkeypatch.setattr(client, "_api_request", fake_api_request)
+
+    assert client.get_cached_user_info() is None
+    assert client.get_user_info() == {"displayName": "User 1"}
+    assert client.get_user_info() == {"displayName": "User 1"}
+    assert calls == ["/me"]
+
+    with client._token_lock:
+        client._set_token_data_locked({"access_token": "new", "expires_at": 10**12})
+
+    assert client.get_cached_user_info() is None
+    assert client.get_user_info() == {"displayName": "User 2"}
+    assert calls == ["/me", "/me"]
+
+
+def test_get_user_info_cache_expires_with_token(monkeypatch):
+    """A cached profile is not served once the token it was fetched with expires."""
+    expires_at = time.time() + OneDriveClient.USER_INFO_CACHE_MARGIN / 2
+    client = OneDriveClient(token_data={"access_token": "token", "expires_at": expires_at})
+    monkeypatch.setattr(
+        client, "_api_request",
+        lambda method, endpoint, **kwargs: FakeJsonResponse({"displayName": "Soon stale"}),
+    )
+
+    assert client.get_user_info() == {"displayName": "Soon stale"}
+    assert client.get_cached_user_info() is None
+
+
+def test_get_user_info_bypasses_cache_when_requested(monkeypatch):
+    """use_cache=False always performs a fresh /me request."""
+    client = OneDriveClient(token_data={"access_token": "token", "expires_at": 10**12})
+    calls = []
+
+    def fake_api_request(method, endpoint, **kwargs):
+        calls.append(endpoint)
+        return FakeJsonResponse({"displayName": "User"})
+
+    monkeypatch.setattr(client, "_api_request", fake_api_request)
+
+    client.get_user_info()
+    client.get_user_info(use_cache=False)
+
+    assert calls == ["/me", "/me"]
+
+
 def _http_error(status_code, headers=None):
     response = requests.Response()
     response.status_code = status_code
@@ -10,6 +10,8 @@ from odsc.path_utils import (
     cleanup_empty_parent_dirs,
     extract_item_path,
     sanitize_onedrive_path,
+    split_parent,
+    validate_sync_child,
     validate_sync_path,
 )
 
@@ -44,6 +46,22 @@ def test_validate_sync_path_rejects_symlink_before_resolution(tmp_path):
         validate_sync_path("linked.txt", sync_dir)
 
 
+def test_validate_sync_child_matches_validate_sync_path(tmp_path):
+    sync_dir = tmp_path / "sync"
+    (sync_dir / "docs").mkdir(parents=True)
+    (sync_dir / "docs" / "a.txt").write_text("data")
+    (sync_dir / "docs" / "linked.txt").symlink_to(sync_dir / "docs" / "a.txt")
+    parent = validate_sync_path("docs", sync_dir)
+
+    assert validate_sync_child(parent, "a.txt") == validate_sync_path("docs/a.txt", sync_dir)
+    assert validate_sync_child(parent, "new.txt") == validate_sync_path("docs/new.txt", sync_dir)
+    with pytest.raises(SecurityError, match="Symlink detected"):
+        validate_sync_child(parent, "linked.txt")
+    for name in ("..", ".", "", "sub/a.txt"):
+        with pytest.raises(SecurityError, match="Invalid path component"):
+            validate_sync_child(parent, name)
+
+
 def test_cleanup_empty_parent_dirs_rejects_paths_outside_sync_root(tmp_path):
     sync_dir = tmp_path / "sync"
     sync_dir.mkdir()
@@ -65,3 +83,11 @@ def test_extract_item_path_builds_safe_relative_path():
     }
 
     assert extract_item_path(item) == str(Path("Documents") / "Reports" / "file.txt")
+
+
+def test_split_parent_matches_pathlib_for_relative_paths():
+    for rel_path in ("top.txt", "Documents/file.txt", "a/b/c.txt"):
+        parent, name = split_parent(rel_path)
+        expected_parent = str(Path(rel_path).parent)
+        assert parent == ("" if expected_parent == "." else expected_parent)
+        assert name == Path(rel_path).name
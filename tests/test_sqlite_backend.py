@@ -6,6 +6,7 @@ import threading
 
 import pytest
 
+from odsc.backends.json_backend import JsonStateBackend
 from odsc.backends.sqlite_backend import SqliteStateBackend
 
 
@@ -131,6 +132,42 @@ def test_save_load_replaces_existing_state(tmp_path):
     assert reloaded["last_sync"] == "2024-01-04T00:00:00"
 
 
+def test_apply_file_cache_changes_touches_only_changed_rows(tmp_path):
+    """Delta writes should upsert and delete cache rows without disturbing others."""
+    db_path = tmp_path / "state.db"
+    backend = SqliteStateBackend(db_path)
+    backend.set_file_cache("keep.txt", {"id": "keep", "size": 1})
+    backend.set_file_cache("gone.txt", {"id": "gone", "size": 2})
+    backend.set_sync_state("keep.txt", {"mtime": 1.0, "size": 1, "downloaded": True})
+
+    backend.apply_file_cache_changes(
+        {"new.txt": {"id": "new", "size": 3}}, ["gone.txt", "missing.txt"], "cursor-3"
+    )
+    backend.close()
+
+    reloaded = SqliteStateBackend(db_path).load()
+
+    assert set(reloaded["file_cache"]) == {"keep.txt", "new.txt"}
+    assert reloaded["file_cache"]["new.txt"]["id"] == "new"
+    assert reloaded["files"]["keep.txt"]["downloaded"] is True
+    assert reloaded["delta_token"] == "cursor-3"
+
+
+def test_default_apply_file_cache_changes_rewrites_full_state(tmp_path):
+    """Backends without their own delta write fall back to load/apply/save."""
+    state_file = tmp_path / "state.json"
+    backend = JsonStateBackend(state_file)
+    backend.set_file_cache("keep.txt", {"id": "keep"})
+    backend.set_file_cache("gone.txt", {"id": "gone"})
+
+    backend.apply_file_cache_changes({"new.txt": {"id": "new"}}, ["gone.txt"], "cursor-3")
+
+    reloaded = JsonStateBackend(state_file).load()
+
+    assert set(reloaded["file_cache"]) == {"keep.txt", "new.txt"}
+    assert reloaded["delta_token"] == "cursor-3"
+
+
 def test_concurrent_writes_share_single_connection_safely(tmp_path):
     """The write lock should serialize concurrent updates without data loss."""
     backend = SqliteStateBackend(tmp_path / "state.db")
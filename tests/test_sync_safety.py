@@ -185,6 +185,24 @@ def test_get_delta_returns_changes_and_token(monkeypatch):
     assert token == "https://graph/next"
 
 
+def test_get_delta_requests_large_pages_and_reports_progress(monkeypatch):
+    client = OneDriveClient(token_data={"access_token": "t", "expires_at": 10**12})
+    pages = {
+        f"{client.API_BASE}/me/drive/root/delta?$top={client.DELTA_PAGE_SIZE}": {
+            "value": [{"id": "1"}, {"id": "2"}], "@odata.nextLink": "https://graph/page2"
+        },
+        "https://graph/page2": {"value": [{"id": "3"}], "@odata.deltaLink": "https://graph/next"},
+    }
+    monkeypatch.setattr(client, "_api_request_url", lambda url, **kw: _DeltaResponse(pages[url]))
+    progress = []
+
+    changes, token = client.get_delta(None, on_page=progress.append)
+
+    assert [item["id"] for item in changes] == ["1", "2", "3"]
+    assert token == "https://graph/next"
+    assert progress == [2, 3]
+
+
 def test_get_delta_raises_without_delta_link(monkeypatch):
     client = OneDriveClient(token_data={"access_token": "t", "expires_at": 10**12})
     monkeypatch.setattr(
@@ -556,3 +574,13 @@ def test_prune_resolved_conflicts_clears_stale_records(daemon):
     conflicts = daemon.state_mgr.all_conflicts()
     assert "gone.txt" not in conflicts   # stale record pruned
     assert "live.txt" in conflicts       # active conflict retained
+
+
+def test_mark_file_not_downloaded_reports_untracked_paths():
+    mgr = SyncStateManager(lambda: {}, lambda state: None)
+    mgr.set_file_entry("Docs/a.txt", 1.0, 10, {"eTag": "1"})
+
+    assert mgr.mark_file_not_downloaded("Docs/a.txt") is True
+    assert mgr.get_file_entry("Docs/a.txt")["downloaded"] is False
+    assert mgr.mark_file_not_downloaded("Docs/missing.txt") is False
+    assert mgr.get_file_entry("Docs/missing.txt") == {}